@@ -1,15 +1,127 @@
+import re
+import sys
 from typing import Dict, List, Optional
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
 from azure.devops.connection import Connection
 from azure.devops.v7_1.work_item_tracking.models import JsonPatchOperation, WorkItem
 from msrest.authentication import BasicAuthentication
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from loguru import logger
 
 from ..models.entities import Task, UserStory, Sprint, WorkFront, TaskStatus
 
+# Número máximo de requisições simultâneas ao Azure DevOps (evita throttling)
+MAX_CONCURRENT_REQUESTS = 16
+
+# Número máximo de IDs aceitos por chamada de get_work_items
+WORK_ITEMS_BATCH_SIZE = 200
+
+# Número máximo de IDs de User Stories no IN de cada query WIQL de Tasks
+WIQL_PARENT_IDS_BATCH_SIZE = 1000
+
+# Queries WIQL da sprint. O WIQL retorna apenas referências aos itens (os campos
+# são obtidos depois via get_work_items), então basta selecionar o ID.
+_WIQL_USER_STORIES = (
+    "SELECT [System.Id] FROM WorkItems"
+    " WHERE [System.TeamProject] = '{project}'"
+    " AND [System.AreaPath] = '{team}'"
+    " AND [System.IterationPath] = '{iteration_path}'"
+    " AND [System.WorkItemType] = 'User Story'"
+    " ORDER BY [Microsoft.VSTS.Common.StackRank] ASC"
+)
+_WIQL_TASKS = (
+    "SELECT [System.Id] FROM WorkItems"
+    " WHERE [System.TeamProject] = '{project}'"
+    " AND [System.WorkItemType] = 'Task'"
+    " AND [System.Parent] IN ({parent_ids})"
+    " ORDER BY [Microsoft.VSTS.Common.StackRank] ASC"
+)
+
+# Número máximo de atualizações por requisição ao endpoint $batch
+UPDATE_BATCH_SIZE = 200
+
+# Versão da API usada no endpoint $batch de work items: a atualização em lote
+# (_apis/wit/$batch) só é documentada até a api-version 5.0
+BATCH_API_VERSION = "5.0"
+
+# Tempo máximo (em segundos) de espera pela resposta do endpoint $batch
+BATCH_REQUEST_TIMEOUT = 60
+
+# Novas tentativas do POST $batch apenas quando o servidor recusou o lote por
+# throttling (429/503). Erros 5xx e falhas de leitura da resposta não são
+# repetidos, pois o lote pode já ter sido aplicado; essas atualizações seguem
+# para o envio individual
+_RETRY_POLICY = Retry(
+    total=3,
+    read=False,
+    backoff_factor=0.3,
+    status_forcelist=[429, 503],
+    allowed_methods=None
+)
+
+# Identifica a frente de trabalho pelo título: tags [BE]/[FE]/[QA] ou "devops" (sem diferenciar caixa)
+_WORK_FRONT_PATTERN = re.compile(r"\[(BE|FE|QA)\]|(?i:devops)")
+_WORK_FRONT_TAGS = {
+    "BE": WorkFront.BACKEND,
+    "FE": WorkFront.FRONTEND,
+    "QA": WorkFront.QA,
+    None: WorkFront.DEVOPS,
+}
+# Prioridade quando o título possui mais de uma marcação (ordem de declaração do enum)
+_WORK_FRONT_PRIORITY = {front: index for index, front in enumerate(WorkFront)}
+
+
+def _detect_work_front(title: str) -> Optional[WorkFront]:
+    """
+    Determina a frente de trabalho de uma task pelo título
+
+    Args:
+        title: Título da task
+
+    Returns:
+        Optional[WorkFront]: Frente de trabalho ou None se não identificada
+    """
+    fronts = [_WORK_FRONT_TAGS[match.group(1)] for match in _WORK_FRONT_PATTERN.finditer(title)]
+    if not fronts:
+        return None
+    return min(fronts, key=_WORK_FRONT_PRIORITY.__getitem__)
+
+
+# Converte datas ISO 8601 do Azure DevOps (ex: 2024-03-18T12:00:00Z).
+# A partir do Python 3.11, fromisoformat aceita o sufixo "Z" diretamente.
+if sys.version_info >= (3, 11):
+    _parse_datetime = datetime.fromisoformat
+else:
+    def _parse_datetime(value: str) -> datetime:
+        return datetime.fromisoformat(value.replace('Z', '+00:00'))
+
+
 class AzureDevOpsClient:
     """Cliente para integração com o Azure DevOps"""
 
+    # Campos atualizados no Azure DevOps: (atributo, caminhos do campo, conversão do valor)
+    _USER_STORY_PATCH_FIELDS = (
+        ("assignee", ("/fields/System.AssignedTo",), None),
+        ("story_points", ("/fields/Microsoft.VSTS.Scheduling.StoryPoints",), None),
+        ("start_date", ("/fields/Microsoft.VSTS.Scheduling.StartDate",), datetime.isoformat),
+        (
+            "end_date",
+            ("/fields/Custom.CommittedDate", "/fields/Microsoft.VSTS.Scheduling.DueDate"),
+            datetime.isoformat,
+        ),
+    )
+    _TASK_PATCH_FIELDS = (
+        ("assignee", ("/fields/System.AssignedTo",), None),
+        ("start_date", ("/fields/Microsoft.VSTS.Scheduling.StartDate",), datetime.isoformat),
+        (
+            "azure_end_date",
+            ("/fields/Custom.CommittedDate", "/fields/Microsoft.VSTS.Scheduling.DueDate"),
+            datetime.isoformat,
+        ),
+    )
+
     def __init__(self, organization: str, project: str, token: str):
         """
         Inicializa o cliente do Azure DevOps
@@ -21,12 +133,25 @@ class AzureDevOpsClient:
         """
         self.organization = organization
         self.project = project
+        self.base_url = f"https://dev.azure.com/{organization}"
         credentials = BasicAuthentication('', token)
         self.connection = Connection(
-            base_url=f"https://dev.azure.com/{organization}",
+            base_url=self.base_url,
             creds=credentials
         )
         self.wit_client = self.connection.clients.get_work_item_tracking_client()
+        # Sem keep_alive o msrest fecha a sessão após cada requisição,
+        # obrigando um novo handshake TLS a cada chamada do SDK
+        self.wit_client.config.keep_alive = True
+
+        # Sessão autenticada para o endpoint $batch, que não é exposto pelo SDK,
+        # com pool de conexões dimensionado para as requisições simultâneas
+        self._session = credentials.signed_session()
+        self._session.mount("https://", HTTPAdapter(
+            pool_connections=MAX_CONCURRENT_REQUESTS,
+            pool_maxsize=MAX_CONCURRENT_REQUESTS,
+            max_retries=_RETRY_POLICY
+        ))
         
         logger.info(f"Cliente Azure DevOps inicializado para {organization}/{project}")
 
@@ -47,19 +172,11 @@ class AzureDevOpsClient:
         iteration_path = f"{self.project}\\{year}\\{quarter}\\{sprint_name}"
         
         # Primeiro, busca as User Stories da sprint
-        wiql_user_stories = f"""
-        SELECT [System.Id],
-               [System.Title],
-               [Microsoft.VSTS.Common.BacklogPriority],
-               [System.BoardColumn],
-               [Microsoft.VSTS.Common.StackRank]
-        FROM WorkItems
-        WHERE [System.TeamProject] = '{self.project}'
-        AND [System.AreaPath] = '{team}'
-        AND [System.IterationPath] = '{iteration_path}'
-        AND [System.WorkItemType] = 'User Story'
-        ORDER BY [Microsoft.VSTS.Common.StackRank] ASC
-        """
+        wiql_user_stories = _WIQL_USER_STORIES.format(
+            project=self.project,
+            team=team,
+            iteration_path=iteration_path
+        )
         
         # Executa query para User Stories
         us_results = self.wit_client.query_by_wiql({"query": wiql_user_stories}).work_items
@@ -67,42 +184,43 @@ class AzureDevOpsClient:
             logger.warning(f"Nenhuma User Story encontrada para sprint {sprint_name}")
             return {"user_stories": [], "tasks": []}
             
-        # Obtém detalhes das User Stories
         us_ids = [item.id for item in us_results]
-        user_stories = self.wit_client.get_work_items(us_ids)
-        for us in user_stories:
-            backlog_priority = us.fields.get("Microsoft.VSTS.Common.BacklogPriority")
-            stack_rank = us.fields.get("Microsoft.VSTS.Common.StackRank")
-            board_column = us.fields.get("System.BoardColumn")
-            logger.info(f"User Story {us.id} - BacklogPriority: {backlog_priority}, StackRank: {stack_rank}, BoardColumn: {board_column}")
-        logger.info(f"Obtidas {len(user_stories)} User Stories da sprint {sprint_name}")
-        
-        # Agora, busca as Tasks vinculadas a essas User Stories
-        tasks = []
-        if us_ids:
-            wiql_tasks = f"""
-            SELECT [System.Id], 
-                   [System.Title], 
-                   [System.Parent],
-                   [System.AssignedTo],
-                   [System.State],
-                   [Microsoft.VSTS.Scheduling.OriginalEstimate],
-                   [System.Description],
-                   [Microsoft.VSTS.Common.BacklogPriority],
-                   [System.BoardColumn],
-                   [Microsoft.VSTS.Common.StackRank]
-            FROM WorkItems
-            WHERE [System.TeamProject] = '{self.project}'
-            AND [System.WorkItemType] = 'Task'
-            AND [System.Parent] IN ({','.join(map(str, us_ids))})
-            ORDER BY [Microsoft.VSTS.Common.StackRank] ASC
-            """
-            
-            # Executa query para Tasks
-            task_results = self.wit_client.query_by_wiql({"query": wiql_tasks}).work_items
+
+        # Query das Tasks vinculadas a essas User Stories, com o IN limitado a
+        # WIQL_PARENT_IDS_BATCH_SIZE IDs por consulta. Todas as Tasks de uma mesma
+        # User Story caem na mesma consulta, preservando a ordem por StackRank.
+        wiql_tasks_batches = [
+            _WIQL_TASKS.format(
+                project=self.project,
+                parent_ids=",".join(map(str, us_ids[i:i + WIQL_PARENT_IDS_BATCH_SIZE]))
+            )
+            for i in range(0, len(us_ids), WIQL_PARENT_IDS_BATCH_SIZE)
+        ]
+
+        with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_REQUESTS) as executor:
+            # Executa as queries de Tasks em paralelo com a busca dos detalhes das User Stories
+            task_queries = [
+                executor.submit(self.wit_client.query_by_wiql, {"query": wiql_tasks})
+                for wiql_tasks in wiql_tasks_batches
+            ]
+
+            # Obtém detalhes das User Stories
+            user_stories = self._get_work_items_batched(executor, us_ids)
+            for us in user_stories:
+                backlog_priority = us.fields.get("Microsoft.VSTS.Common.BacklogPriority")
+                stack_rank = us.fields.get("Microsoft.VSTS.Common.StackRank")
+                board_column = us.fields.get("System.BoardColumn")
+                logger.info(f"User Story {us.id} - BacklogPriority: {backlog_priority}, StackRank: {stack_rank}, BoardColumn: {board_column}")
+            logger.info(f"Obtidas {len(user_stories)} User Stories da sprint {sprint_name}")
+
+            # Agora, obtém os detalhes das Tasks vinculadas às User Stories
+            tasks = []
+            task_results = []
+            for task_query in task_queries:
+                task_results.extend(task_query.result().work_items or [])
             if task_results:
                 task_ids = [item.id for item in task_results]
-                tasks = self.wit_client.get_work_items(task_ids, expand="All")
+                tasks = self._get_work_items_batched(executor, task_ids, expand="All")
                 for task in tasks:
                     backlog_priority = task.fields.get("Microsoft.VSTS.Common.BacklogPriority")
                     stack_rank = task.fields.get("Microsoft.VSTS.Common.StackRank")
@@ -114,6 +232,30 @@ class AzureDevOpsClient:
         
         return {"user_stories": user_stories, "tasks": tasks}
 
+    def _get_work_items_batched(self, executor: ThreadPoolExecutor, ids: List[int], expand: Optional[str] = None) -> List[WorkItem]:
+        """
+        Obtém os detalhes de work items em lotes paralelos
+
+        A API do Azure DevOps aceita no máximo WORK_ITEMS_BATCH_SIZE IDs por chamada,
+        então os IDs são divididos em lotes buscados simultaneamente.
+
+        Args:
+            executor: Pool de threads usado para as requisições
+            ids: IDs dos work items
+            expand: Opção de expansão dos work items (ex: "All")
+
+        Returns:
+            List[WorkItem]: Work items na mesma ordem dos IDs informados
+        """
+        futures = [
+            executor.submit(self.wit_client.get_work_items, ids[i:i + WORK_ITEMS_BATCH_SIZE], expand=expand)
+            for i in range(0, len(ids), WORK_ITEMS_BATCH_SIZE)
+        ]
+        work_items = []
+        for future in futures:
+            work_items.extend(future.result())
+        return work_items
+
     def convert_to_entities(self, items: dict, sprint_name: str, team: str, year: str = None, quarter: str = None) -> Sprint:
         """
         Converte itens do Azure DevOps para entidades do sistema
@@ -134,36 +276,42 @@ class AzureDevOpsClient:
         
         # Processa as User Stories
         for item in items["user_stories"]:
+            fields = item.fields
+
             # Obtém as datas da User Story
             start_date = None
             end_date = None
             
-            if item.fields.get("Microsoft.VSTS.Scheduling.StartDate"):
-                start_date = datetime.fromisoformat(item.fields["Microsoft.VSTS.Scheduling.StartDate"].replace('Z', '+00:00'))
+            start_raw = fields.get("Microsoft.VSTS.Scheduling.StartDate")
+            if start_raw:
+                start_date = _parse_datetime(start_raw)
             
-            if item.fields.get("Microsoft.VSTS.Scheduling.DueDate"):
-                end_date = datetime.fromisoformat(item.fields["Microsoft.VSTS.Scheduling.DueDate"].replace('Z', '+00:00'))
+            due_raw = fields.get("Microsoft.VSTS.Scheduling.DueDate")
+            if due_raw:
+                end_date = _parse_datetime(due_raw)
             
+            assigned_to = fields.get("System.AssignedTo")
             us = UserStory(
                 id=str(item.id),
-                title=item.fields["System.Title"],
-                description=item.fields.get("System.Description"),
+                title=fields["System.Title"],
+                description=fields.get("System.Description"),
                 tasks=[],
-                assignee=item.fields.get("System.AssignedTo", {}).get("uniqueName") if item.fields.get("System.AssignedTo") else None,
+                assignee=assigned_to.get("uniqueName") if assigned_to else None,
                 start_date=start_date,
                 end_date=end_date,
-                story_points=item.fields.get("Microsoft.VSTS.Scheduling.StoryPoints")
+                story_points=fields.get("Microsoft.VSTS.Scheduling.StoryPoints")
             )
             user_stories[us.id] = us
         
         # Processa as Tasks que já sabemos que pertencem às User Stories
         for item in items["tasks"]:
             # Log para debug
-            logger.debug(f"Processando task {item.id}")
-            logger.debug(f"Campos disponíveis: {item.fields}")
+            logger.debug("Processando task {}", item.id)
+            logger.opt(lazy=True).debug("Campos disponíveis: {}", lambda: item.fields)
+            fields = item.fields
             
             # Verifica se a task está fechada
-            state = item.fields.get("System.State", "").lower()
+            state = fields.get("System.State", "").lower()
             if state == "closed":
                 logger.info(f"Task {item.id} está fechada, ignorando")
                 continue
@@ -174,29 +322,22 @@ class AzureDevOpsClient:
                 continue
             
             # Determina frente de trabalho pelo título
-            title = item.fields["System.Title"]
-            work_front = None
-            if "[BE]" in title:
-                work_front = WorkFront.BACKEND
-            elif "[FE]" in title:
-                work_front = WorkFront.FRONTEND
-            elif "[QA]" in title:
-                work_front = WorkFront.QA
-            elif "devops" in title.lower():
-                work_front = WorkFront.DEVOPS
+            title = fields["System.Title"]
+            work_front = _detect_work_front(title)
             
             if not work_front:
                 logger.warning(f"Não foi possível determinar frente de trabalho para task {item.id}: {title}")
                 continue
             
             # Obtém o ID da US pai da task
-            parent_ref = item.fields.get("System.Parent")
+            parent_ref = fields.get("System.Parent")
             if not parent_ref:
                 logger.warning(f"Task {item.id} não tem campo System.Parent")
                 continue
                 
             us_id = str(parent_ref)
-            if us_id not in user_stories:
+            parent_us = user_stories.get(us_id)
+            if parent_us is None:
                 logger.warning(f"Task {item.id} tem parent_id {us_id} que não está nas User Stories obtidas")
                 continue
             
@@ -205,20 +346,23 @@ class AzureDevOpsClient:
             end_date = None
             azure_end_date = None
             
-            if item.fields.get("Microsoft.VSTS.Scheduling.StartDate"):
-                start_date = datetime.fromisoformat(item.fields["Microsoft.VSTS.Scheduling.StartDate"].replace('Z', '+00:00'))
+            start_raw = fields.get("Microsoft.VSTS.Scheduling.StartDate")
+            if start_raw:
+                start_date = _parse_datetime(start_raw)
             
-            if item.fields.get("Custom.CommittedDate"):
-                end_date = datetime.fromisoformat(item.fields["Custom.CommittedDate"].replace('Z', '+00:00'))
+            committed_raw = fields.get("Custom.CommittedDate")
+            if committed_raw:
+                end_date = _parse_datetime(committed_raw)
                 azure_end_date = end_date
             
+            assigned_to = fields.get("System.AssignedTo")
             task = Task(
                 id=str(item.id),
                 title=title,
-                description=item.fields.get("System.Description"),
+                description=fields.get("System.Description"),
                 work_front=work_front,
-                estimated_hours=float(item.fields.get("Microsoft.VSTS.Scheduling.OriginalEstimate", 0)),
-                assignee=item.fields.get("System.AssignedTo", {}).get("uniqueName") if item.fields.get("System.AssignedTo") else None,
+                estimated_hours=float(fields.get("Microsoft.VSTS.Scheduling.OriginalEstimate", 0)),
+                assignee=assigned_to.get("uniqueName") if assigned_to else None,
                 dependencies=[],  # Será preenchido depois
                 start_date=start_date,
                 end_date=end_date,
@@ -226,7 +370,7 @@ class AzureDevOpsClient:
                 status=TaskStatus.PENDING,  # Todas tasks ativas começam como pendentes
                 parent_user_story_id=us_id
             )
-            user_stories[us_id].tasks.append(task)
+            parent_us.tasks.append(task)
             tasks_count += 1
         
         # Cria sprint
@@ -241,93 +385,116 @@ class AzureDevOpsClient:
         logger.info(f"Convertidos {len(user_stories)} User Stories e {tasks_count} Tasks")
         return sprint
 
+    def _build_operations(self, item, field_map) -> List[dict]:
+        """
+        Monta as operações JSON Patch de atualização de um work item
+
+        Args:
+            item: User Story ou Task a ser atualizada
+            field_map: Tabela (atributo, caminhos no Azure DevOps, conversão) dos campos
+
+        Returns:
+            List[dict]: Operações de atualização (vazia se não houver o que atualizar)
+        """
+        operations = []
+        for attr, paths, transform in field_map:
+            value = getattr(item, attr)
+            # Ignora campos ausentes ou vazios, mas permite valor 0 (ex: story points)
+            if value is None or value == "":
+                continue
+            if transform:
+                value = transform(value)
+            operations.extend({"op": "add", "path": path, "value": value} for path in paths)
+        return operations
+
     def update_work_items(self, sprint: Sprint) -> None:
         """
         Atualiza os itens de trabalho no Azure DevOps
+
+        As atualizações são agrupadas em lotes de até UPDATE_BATCH_SIZE itens
+        enviados ao endpoint $batch em paralelo (limitados a
+        MAX_CONCURRENT_REQUESTS simultâneos). Itens que o lote não aplicar são
+        reenviados individualmente pelo SDK.
         
         Args:
             sprint: Sprint com itens atualizados
         """
+        # Monta as atualizações de User Stories e Tasks
+        updates = []
         for us in sprint.user_stories:
-            # Atualiza User Story
-            us_operations = []
-            
-            # Atualiza responsável
-            if us.assignee:
-                us_operations.append({
-                    "op": "add",
-                    "path": "/fields/System.AssignedTo",
-                    "value": us.assignee
-                })
-                
-            # Atualiza Story Points
-            if us.story_points is not None:  # Permite valor 0
-                us_operations.append({
-                    "op": "add",
-                    "path": "/fields/Microsoft.VSTS.Scheduling.StoryPoints",
-                    "value": us.story_points
-                })
-                
-            # Atualiza datas da US
-            if us.start_date:
-                us_operations.append({
-                    "op": "add",
-                    "path": "/fields/Microsoft.VSTS.Scheduling.StartDate",
-                    "value": us.start_date.isoformat()
-                })
-                
-            if us.end_date:
-                us_operations.extend([
-                    {
-                        "op": "add",
-                        "path": "/fields/Custom.CommittedDate",
-                        "value": us.end_date.isoformat()
-                    },
-                    {
-                        "op": "add",
-                        "path": "/fields/Microsoft.VSTS.Scheduling.DueDate",
-                        "value": us.end_date.isoformat()
-                    }
-                ])
-                
+            us_operations = self._build_operations(us, self._USER_STORY_PATCH_FIELDS)
             if us_operations:
-                self.wit_client.update_work_item(us_operations, int(us.id))
-                logger.info(f"User Story {us.id} atualizada no Azure DevOps")
-            
-            # Atualiza Tasks
+                updates.append(("User Story", us.id, us_operations))
+
             for task in us.tasks:
-                task_operations = []
-                
-                # Atualiza responsável
-                if task.assignee:
-                    task_operations.append({
-                        "op": "add",
-                        "path": "/fields/System.AssignedTo",
-                        "value": task.assignee
-                    })
-                    
-                # Atualiza datas da task
-                if task.start_date:
-                    task_operations.append({
-                        "op": "add",
-                        "path": "/fields/Microsoft.VSTS.Scheduling.StartDate",
-                        "value": task.start_date.isoformat()
-                    })
-                    
-                if task.azure_end_date:
-                    task_operations.extend([
-                        {
-                            "op": "add",
-                            "path": "/fields/Custom.CommittedDate",
-                            "value": task.azure_end_date.isoformat()
-                        },
-                        {
-                            "op": "add",
-                            "path": "/fields/Microsoft.VSTS.Scheduling.DueDate",
-                            "value": task.azure_end_date.isoformat()
-                        }
-                    ])
-                    
+                task_operations = self._build_operations(task, self._TASK_PATCH_FIELDS)
                 if task_operations:
-                    self.wit_client.update_work_item(task_operations, int(task.id))
-                    logger.info(f"Task {task.id} atualizada no Azure DevOps") 
\ No newline at end of file
+                    updates.append(("Task", task.id, task_operations))
+
+        if not updates:
+            return
+
+        # Envia as atualizações em lotes pelo endpoint $batch, em paralelo
+        batches = [
+            updates[i:i + UPDATE_BATCH_SIZE]
+            for i in range(0, len(updates), UPDATE_BATCH_SIZE)
+        ]
+        max_workers = min(MAX_CONCURRENT_REQUESTS, len(updates))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            pending = []
+            for failed in executor.map(self._send_update_batch, batches):
+                pending.extend(failed)
+
+            # Itens não aplicados pelo lote são atualizados individualmente
+            futures = [
+                executor.submit(self.wit_client.update_work_item, operations, int(item_id))
+                for _, item_id, operations in pending
+            ]
+            for (kind, item_id, _), future in zip(pending, futures):
+                future.result()
+                logger.info(f"{kind} {item_id} atualizada no Azure DevOps")
+
+    def _send_update_batch(self, updates: List[tuple]) -> List[tuple]:
+        """
+        Envia um lote de atualizações em uma única requisição ao endpoint $batch
+        
+        Args:
+            updates: Lista de tuplas (tipo, id, operações)
+            
+        Returns:
+            List[tuple]: Atualizações que não foram aplicadas pelo lote
+        """
+        payload = [
+            {
+                "method": "PATCH",
+                "uri": f"/_apis/wit/workitems/{item_id}?api-version={BATCH_API_VERSION}",
+                "headers": {"Content-Type": "application/json-patch+json"},
+                "body": operations,
+            }
+            for _, item_id, operations in updates
+        ]
+
+        try:
+            response = self._session.post(
+                f"{self.base_url}/_apis/wit/$batch?api-version={BATCH_API_VERSION}",
+                json=payload,
+                timeout=BATCH_REQUEST_TIMEOUT
+            )
+            response.raise_for_status()
+            results = response.json()["value"]
+        except Exception as e:
+            logger.warning(f"Falha ao enviar lote de atualizações, enviando individualmente: {str(e)}")
+            return updates
+
+        if len(results) != len(updates):
+            logger.warning("Resposta do lote incompleta, enviando atualizações individualmente")
+            return updates
+
+        failed = []
+        for (kind, item_id, operations), result in zip(updates, results):
+            if result.get("code") == 200:
+                logger.info(f"{kind} {item_id} atualizada no Azure DevOps")
+            else:
+                logger.warning(f"Falha ao atualizar {kind} {item_id} no lote (código {result.get('code')})")
+                failed.append((kind, item_id, operations))
+        return failed
@@ -3,6 +3,7 @@ import os
 import sys
 from datetime import datetime
 from pathlib import Path
+from typing import List, Optional
 import typer
 from loguru import logger
 from rich.console import Console
@@ -14,9 +15,6 @@ sys.path.append(str(WORKSPACE_ROOT))
 
 # Importando módulos do projeto
 from src.models.config import SetupConfig, ExecutorsConfig, DependenciesConfig, DayOff
-from src.azure.client import AzureDevOpsClient
-from src.services.scheduler import SprintScheduler
-from src.services.report import ReportGenerator
 
 app = typer.Typer(help="Agendador de Sprint - Sistema de Gerenciamento")
 console = Console()
@@ -52,7 +50,7 @@ def load_json_file(path: Path) -> dict:
         dict: Conteúdo do arquivo
     """
     try:
-        return json.loads(path.read_text(encoding='utf-8'))
+        return json.loads(path.read_bytes())
     except Exception as e:
         logger.error(f"Erro ao carregar arquivo {path}: {str(e)}")
         raise typer.Exit(1)
@@ -65,9 +63,30 @@ def executar(
         exists=True,
         dir_okay=True,
         file_okay=False
+    ),
+    formatos: Optional[List[str]] = typer.Option(
+        None,
+        "--formato",
+        help="Formato do relatório (md, pdf ou xlsx); pode ser repetido. Padrão: todos"
     )
 ):
     """Executa o agendamento da sprint"""
+    # Serviços que dependem de bibliotecas pesadas (SDK do Azure DevOps, reportlab,
+    # openpyxl) são importados apenas na execução, para que --help responda rápido
+    from src.azure.client import AzureDevOpsClient
+    from src.services.scheduler import SprintScheduler
+    from src.services.report import ReportGenerator, REPORT_FORMATS
+
+    # Valida os formatos antes de qualquer acesso ao Azure DevOps, para que um
+    # formato inválido não deixe work items atualizados sem relatório
+    invalid_formats = set(formatos or ()).difference(REPORT_FORMATS)
+    if invalid_formats:
+        raise typer.BadParameter(
+            f"formatos inválidos: {', '.join(sorted(invalid_formats))} "
+            f"(use {', '.join(REPORT_FORMATS)})",
+            param_hint="--formato"
+        )
+
     try:
         # Configuração inicial
         verificar_diretorios()
@@ -129,11 +148,12 @@ def executar(
         sprint.end_date = setup.sprint.end_date
         
         # Adiciona dependências às tasks
-        all_tasks = sprint.get_all_tasks()
-        task_dict = {t.id: t for t in all_tasks}
+        task_dict = {t.id: t for us in sprint.user_stories for t in us.tasks}
+        get_task = task_dict.get
         for task_id, deps in dependencies.dependencies.items():
-            if task_id in task_dict:
-                task_dict[task_id].dependencies = deps
+            task = get_task(task_id)
+            if task is not None:
+                task.dependencies = deps
         
         # Executa agendamento
         logger.info("Iniciando agendamento...")
@@ -147,7 +167,7 @@ def executar(
         # Gera o relatório
         logger.info("Gerando relatório...")
         report = ReportGenerator(sprint, dayoffs, setup.output_dir, setup.team, executors, timezone_str=setup.timezone)
-        report.generate()
+        report.generate(formats=formatos)
         
         logger.info("Processo concluído com sucesso!")
         
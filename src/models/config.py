@@ -1,11 +1,13 @@
 from datetime import datetime
-from typing import Dict, List, Optional
-from pydantic import BaseModel, Field, field_validator
+from typing import Any, Dict, List, Optional
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, field_validator
 
 
 class AzureDevOpsConfig(BaseModel):
     """Configuração do Azure DevOps"""
 
+    model_config = ConfigDict(frozen=True)
+
     organization: str
     project: str
     token: str
@@ -14,6 +16,8 @@ class AzureDevOpsConfig(BaseModel):
 class SprintConfig(BaseModel):
     """Configuração da Sprint"""
 
+    model_config = ConfigDict(frozen=True)
+
     name: str
     year: str
     quarter: str
@@ -33,6 +37,8 @@ class SprintConfig(BaseModel):
 class SetupConfig(BaseModel):
     """Configuração principal do sistema"""
 
+    model_config = ConfigDict(frozen=True)
+
     azure_devops: AzureDevOpsConfig
     sprint: SprintConfig
     team: str
@@ -46,6 +52,8 @@ class SetupConfig(BaseModel):
 class DayOff(BaseModel):
     """Modelo para ausências"""
 
+    model_config = ConfigDict(frozen=True)
+
     date: str
     period: str = Field(..., pattern="^(full|morning|afternoon)$")
 
@@ -62,23 +70,34 @@ class DayOff(BaseModel):
 class Executor(BaseModel):
     """Modelo para executor"""
 
+    model_config = ConfigDict(frozen=True)
+
     email: str
     capacity: int
 
+    # Email em lowercase, calculado uma única vez na criação
+    _email_lower: str = PrivateAttr(default="")
+
+    def model_post_init(self, __context: Any) -> None:
+        """Armazena o email em lowercase usado em hash e comparações"""
+        self._email_lower = self.email.lower()
+
     def __hash__(self) -> int:
         """Retorna o hash do executor baseado no email em lowercase"""
-        return hash(self.email.lower())
+        return hash(self._email_lower)
 
     def __eq__(self, other: object) -> bool:
         """Compara dois executores baseado no email em lowercase"""
         if not isinstance(other, Executor):
             return NotImplemented
-        return self.email.lower() == other.email.lower()
+        return self._email_lower == other._email_lower
 
 
 class ExecutorsConfig(BaseModel):
     """Configuração dos executores por frente"""
 
+    model_config = ConfigDict(frozen=True)
+
     backend: List[Executor]
     frontend: List[Executor]
     qa: List[Executor]
@@ -88,4 +107,6 @@ class ExecutorsConfig(BaseModel):
 class DependenciesConfig(BaseModel):
     """Configuração de dependências entre tasks"""
 
+    model_config = ConfigDict(frozen=True)
+
     dependencies: Dict[str, List[str]]
@@ -1,7 +1,10 @@
+from bisect import bisect_left
 from datetime import datetime
 from typing import Dict, List, Optional
 from enum import Enum
-from pydantic import BaseModel, Field
+from itertools import chain
+from dataclasses import dataclass, field
+from pydantic import BaseModel
 
 class WorkFront(str, Enum):
     """Frentes de trabalho disponíveis"""
@@ -18,7 +21,17 @@ class TaskStatus(str, Enum):
     CLOSED = "closed"
     CANCELLED = "cancelled"
 
-class Task(BaseModel):
+# Tabela de conversão de horas para story points: até _STORY_POINT_HOURS[i] horas
+# valem _STORY_POINTS[i] pontos; acima do último limite, o último valor
+_STORY_POINT_HOURS = (1, 2, 3, 5, 9, 14, 23, 37, 60)
+_STORY_POINTS = (0.5, 1, 2, 3, 5, 8, 13, 21, 34, 55)
+
+def hours_to_story_points(total_hours: float) -> float:
+    """Converte o total de horas estimadas em story points"""
+    return _STORY_POINTS[bisect_left(_STORY_POINT_HOURS, total_hours)]
+
+@dataclass(slots=True, kw_only=True)
+class Task:
     """Modelo de uma task"""
     id: str
     title: str
@@ -26,7 +39,7 @@ class Task(BaseModel):
     work_front: WorkFront
     estimated_hours: float
     assignee: Optional[str]
-    dependencies: List[str] = Field(default_factory=list)
+    dependencies: List[str] = field(default_factory=list)
     start_date: Optional[datetime]
     end_date: Optional[datetime]
     azure_end_date: Optional[datetime]
@@ -43,12 +56,13 @@ class Task(BaseModel):
         """Verifica se é uma task de DevOps"""
         return self.work_front == WorkFront.DEVOPS
 
-class UserStory(BaseModel):
+@dataclass(slots=True, kw_only=True)
+class UserStory:
     """Modelo de uma User Story"""
     id: str
     title: str
     description: Optional[str]
-    tasks: List[Task] = Field(default_factory=list)
+    tasks: List[Task] = field(default_factory=list)
     assignee: Optional[str]
     start_date: Optional[datetime]
     end_date: Optional[datetime]
@@ -57,18 +71,7 @@ class UserStory(BaseModel):
     def calculate_story_points(self) -> float:
         """Calcula os story points baseado na soma das horas das tasks"""
         total_hours = sum(task.estimated_hours for task in self.tasks if task.status != TaskStatus.CANCELLED)
-        
-        # Tabela de conversão de horas para story points
-        if total_hours <= 1: return 0.5
-        elif total_hours <= 2: return 1
-        elif total_hours <= 3: return 2
-        elif total_hours <= 5: return 3
-        elif total_hours <= 9: return 5
-        elif total_hours <= 14: return 8
-        elif total_hours <= 23: return 13
-        elif total_hours <= 37: return 21
-        elif total_hours <= 60: return 34
-        else: return 55
+        return hours_to_story_points(total_hours)
 
     def get_tasks_by_work_front(self, work_front: WorkFront) -> List[Task]:
         """Retorna todas as tasks de uma determinada frente de trabalho"""
@@ -76,6 +79,11 @@ class UserStory(BaseModel):
 
 class Sprint:
     """Representa uma sprint do projeto"""
+
+    __slots__ = (
+        "name", "start_date", "end_date", "team", "metrics",
+        "user_stories",
+    )
     
     def __init__(self, name: str, start_date: datetime, end_date: datetime, user_stories: List[UserStory] = None, team: str = None):
         self.name = name
@@ -84,33 +92,48 @@ class Sprint:
         self.user_stories: List[UserStory] = user_stories or []
         self.team = team
         self.metrics = SprintMetrics()
-    
+
     def add_user_story(self, user_story: UserStory) -> None:
         """Adiciona uma user story à sprint"""
         self.user_stories.append(user_story)
     
     def get_all_tasks(self) -> List[Task]:
         """Retorna todas as tasks da sprint"""
-        tasks = []
-        for us in self.user_stories:
-            tasks.extend(us.tasks)
-        return tasks
-        
+        return list(chain.from_iterable(us.tasks for us in self.user_stories))
+
     def get_tasks_by_assignee(self, assignee: str) -> List[Task]:
         """Retorna todas as tasks atribuídas a um executor"""
-        tasks = []
-        for us in self.user_stories:
-            for task in us.tasks:
-                if task.assignee and task.assignee.lower() == assignee.lower():
-                    tasks.append(task)
-        return tasks
+        assignee = assignee.lower()
+        return [
+            task
+            for us in self.user_stories
+            for task in us.tasks
+            if task.assignee and task.assignee.lower() == assignee
+        ]
 
 class SprintMetrics(BaseModel):
     """Métricas globais da sprint"""
     total_capacity: Dict[str, float] = {}  # Capacidade total por executor
     used_capacity: Dict[str, float] = {}   # Capacidade utilizada por executor
     available_capacity: Dict[str, float] = {}  # Capacidade disponível por executor
-    not_scheduled_tasks: List[Dict] = []  # Tasks não agendadas com seus motivos
+    # Tasks não agendadas com seus motivos, em colunas paralelas (uma posição por task)
+    not_scheduled_task_ids: List[str] = []
+    not_scheduled_titles: List[str] = []
+    not_scheduled_reasons: List[str] = []
+    not_scheduled_us_ids: List[Optional[str]] = []
+
+    @property
+    def not_scheduled_tasks(self) -> List[Dict]:
+        """Tasks não agendadas no formato de dicionário (compatibilidade)"""
+        return [
+            {"task_id": task_id, "title": title, "reason": reason, "user_story_id": us_id}
+            for task_id, title, reason, us_id in zip(
+                self.not_scheduled_task_ids,
+                self.not_scheduled_titles,
+                self.not_scheduled_reasons,
+                self.not_scheduled_us_ids
+            )
+        ]
 
     def update_capacity(self, executor: str, total: float, used: float) -> None:
         """Atualiza as métricas de capacidade de um executor"""
@@ -120,9 +143,7 @@ class SprintMetrics(BaseModel):
 
     def add_not_scheduled_task(self, task_id: str, title: str, reason: str, user_story_id: Optional[str] = None) -> None:
         """Adiciona uma task não agendada com seu motivo"""
-        self.not_scheduled_tasks.append({
-            "task_id": task_id,
-            "title": title,
-            "reason": reason,
-            "user_story_id": user_story_id
-        }) 
\ No newline at end of file
+        self.not_scheduled_task_ids.append(task_id)
+        self.not_scheduled_titles.append(title)
+        self.not_scheduled_reasons.append(reason)
+        self.not_scheduled_us_ids.append(user_story_id)
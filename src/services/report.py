@@ -1,27 +1,73 @@
-from datetime import datetime, timedelta, time, timezone
-from typing import Dict, List, Optional
+from datetime import date, datetime, timedelta, time, timezone
+from typing import BinaryIO, Dict, Iterable, Iterator, List, Optional
 from pathlib import Path
-import json
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from itertools import chain
+import io
+import os
 from loguru import logger
-import markdown
 from reportlab.lib import colors
 from reportlab.lib.pagesizes import A4
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib.units import cm
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle, LongTable
+from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, TableStyle, LongTable
 from reportlab.lib.enums import TA_LEFT, TA_CENTER
 from reportlab.platypus.flowables import KeepTogether
 import openpyxl
 from openpyxl.styles import PatternFill, Border, Side, Alignment, Font
+from openpyxl.cell import WriteOnlyCell
 from openpyxl.utils import get_column_letter
+from openpyxl.utils.cell import get_column_interval
 from zoneinfo import ZoneInfo
 
-from ..models.entities import Task, UserStory, Sprint, TaskStatus, WorkFront, SprintMetrics
-from ..models.config import DayOff, ExecutorsConfig
+from ..models.entities import Sprint, TaskStatus, WorkFront
+from ..models.config import DayOff, Executor, ExecutorsConfig
+
+# Formatos de relatório suportados: Markdown, PDF e Excel
+REPORT_FORMATS = ("md", "pdf", "xlsx")
+
+# Descrição dos períodos de ausência exibida nos relatórios
+_PERIOD_LABELS = {
+    "full": "dia inteiro",
+    "morning": "manhã",
+    "afternoon": "tarde"
+}
+
+# Horários dos períodos de trabalho considerados no mapa de alocação do Excel
+_MORNING_START = time(9, 0)
+_MORNING_END = time(12, 0)
+_AFTERNOON_START = time(14, 0)
+_AFTERNOON_END = time(17, 0)
+
+# Status de tasks que não ocupam a agenda do executor
+_INACTIVE_STATUSES = frozenset({TaskStatus.CLOSED, TaskStatus.CANCELLED})
+
+# Alocação [manhã, tarde] dos dias sem tasks
+_NO_ALLOCATION = (0, 0)
+
+# Escape dos caracteres reservados da marcação dos Paragraphs do ReportLab
+_XML_ESCAPE = str.maketrans({"&": "&amp;", "<": "&lt;", ">": "&gt;"})
 
 class ReportGenerator:
     """Serviço responsável pela geração de relatórios"""
 
+    __slots__ = (
+        "sprint", "dayoffs", "output_dir", "team_name", "executors", "metrics",
+        "timezone", "styles", "excel_colors",
+        "_dayoffs_by_email", "_date_labels", "_executor_capacity_rows",
+        "_user_story_rows", "_sorted_executors", "_capacity_summary", "_table_style",
+    )
+
+    # Proporção da largura útil da página ocupada por cada coluna das tabelas do PDF
+    _US_COLUMN_RATIOS = (0.1, 0.5, 0.15, 0.15, 0.1)  # ID, Título, Responsável, Data, Story Points
+    _NOT_SCHEDULED_COLUMN_RATIOS = (0.1, 0.4, 0.2, 0.3)  # ID, Título, User Story, Motivo
+    _CAPACITY_COLUMN_RATIOS = (0.25, 0.15, 0.15, 0.15, 0.3)  # Executor, Total, Utilizada, Disponível, Ausências
+    _CAPACITY_SUMMARY_COLUMN_RATIOS = (0.6, 0.4)  # Métrica, Valor
+
+    # Folha de estilos e estilo de tabela do PDF compartilhados entre os relatórios
+    _shared_styles: Optional[tuple] = None
+
     def __init__(self, sprint: Sprint, dayoffs: Dict[str, List[DayOff]], output_dir: str, team_name: str, executors: ExecutorsConfig, timezone_str: str = "America/Sao_Paulo"):
         """
         Inicializa o gerador de relatórios
@@ -36,6 +82,10 @@ class ReportGenerator:
         """
         self.sprint = sprint
         self.dayoffs = dayoffs
+        # Ausências indexadas pelo email em lowercase (mantém a primeira ocorrência)
+        self._dayoffs_by_email: Dict[str, List[DayOff]] = {}
+        for name, executor_dayoffs in dayoffs.items():
+            self._dayoffs_by_email.setdefault(name.lower(), executor_dayoffs)
         self.output_dir = Path(output_dir)
         # Ajusta o nome da equipe para o último segmento após a última barra invertida
         if team_name is None:
@@ -44,22 +94,36 @@ class ReportGenerator:
             self.team_name = str(team_name).split("\\")[-1]
         self.executors = executors
         self.metrics = sprint.metrics
+        # Datas já formatadas (dd/mm/aaaa), indexadas pelo dia
+        self._date_labels: Dict[date, str] = {}
+        # Linhas da tabela de capacity, calculadas sob demanda
+        self._executor_capacity_rows: Optional[List[tuple]] = None
+        # Linhas da tabela de User Stories, calculadas sob demanda
+        self._user_story_rows: Optional[List[tuple]] = None
+        # Executores de todas as frentes ordenados por email, calculados sob demanda
+        self._sorted_executors: Optional[List[Executor]] = None
+        # Resumo de capacity (percentual, disponível, utilizada), calculado sob demanda
+        self._capacity_summary: Optional[tuple] = None
         self.timezone = ZoneInfo(timezone_str)
         
         # Cria o diretório de saída se não existir
         self.output_dir.mkdir(parents=True, exist_ok=True)
         
-        # Define os estilos do PDF
-        self.styles = getSampleStyleSheet()
-        self._setup_styles()
+        # Define os estilos do PDF, montados uma única vez e reaproveitados pelas demais instâncias
+        if ReportGenerator._shared_styles is None:
+            self.styles = getSampleStyleSheet()
+            self._setup_styles()
+            # Estilo comum a todas as tabelas do PDF (setStyle apenas lê os comandos)
+            ReportGenerator._shared_styles = (self.styles, self._create_table_style())
+        self.styles, self._table_style = ReportGenerator._shared_styles
         
-        # Define as cores para o Excel
+        # Define as cores para o Excel (ARGB com alfa FF, opaco)
         self.excel_colors = {
-            'weekend': PatternFill(start_color='E0E0E0', end_color='E0E0E0', fill_type='solid'),  # Cinza claro
-            'dayoff': PatternFill(start_color='FF6B6B', end_color='FF6B6B', fill_type='solid'),   # Vermelho suave
-            'full': PatternFill(start_color='51CF66', end_color='51CF66', fill_type='solid'),     # Verde
-            'partial': PatternFill(start_color='4DABF7', end_color='4DABF7', fill_type='solid'),  # Azul claro
-            'empty': PatternFill(start_color='FFE066', end_color='FFE066', fill_type='solid')     # Amarelo pastel
+            'weekend': PatternFill(start_color='FFE0E0E0', end_color='FFE0E0E0', fill_type='solid'),  # Cinza claro
+            'dayoff': PatternFill(start_color='FFFF6B6B', end_color='FFFF6B6B', fill_type='solid'),   # Vermelho suave
+            'full': PatternFill(start_color='FF51CF66', end_color='FF51CF66', fill_type='solid'),     # Verde
+            'partial': PatternFill(start_color='FF4DABF7', end_color='FF4DABF7', fill_type='solid'),  # Azul claro
+            'empty': PatternFill(start_color='FFFFE066', end_color='FFFFE066', fill_type='solid')     # Amarelo pastel
         }
         
         # Ajusta datas da sprint para o timezone correto
@@ -71,12 +135,6 @@ class ReportGenerator:
             self.sprint.end_date = self.sprint.end_date.replace(tzinfo=self.timezone)
         else:
             self.sprint.end_date = self.sprint.end_date.astimezone(self.timezone)
-        
-        # Define os horários dos períodos
-        self.morning_start = datetime.strptime('09:00', '%H:%M').time()
-        self.morning_end = datetime.strptime('12:00', '%H:%M').time()
-        self.afternoon_start = datetime.strptime('14:00', '%H:%M').time()
-        self.afternoon_end = datetime.strptime('17:00', '%H:%M').time()
 
     def _setup_styles(self):
         """Configura estilos personalizados para o relatório"""
@@ -148,6 +206,9 @@ class ReportGenerator:
             ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
             ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
             ('FONTSIZE', (0, 0), (-1, 0), 10),
+            # Células com texto simples (sem Paragraph) seguem o tamanho do estilo TableCell
+            ('FONTSIZE', (0, 1), (-1, -1), 9),
+            ('LEADING', (0, 1), (-1, -1), 11),
             ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
             ('GRID', (0, 0), (-1, -1), 1, colors.black),
             ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
@@ -170,148 +231,305 @@ class ReportGenerator:
         Returns:
             int: Número de dias úteis
         """
-        working_days = 0
-        current_date = start_date
-        while current_date <= end_date:
-            # 5 = Sábado, 6 = Domingo
-            if current_date.weekday() < 5:
-                working_days += 1
-            current_date += timedelta(days=1)
-        return working_days
+        if end_date < start_date:
+            return 0
+
+        # Semanas completas têm sempre 5 dias úteis; só os dias restantes são verificados
+        total_days = (end_date - start_date).days + 1
+        full_weeks, remaining_days = divmod(total_days, 7)
+        first_weekday = start_date.weekday()
+        # 5 = Sábado, 6 = Domingo
+        remaining_weekend = sum(1 for i in range(remaining_days) if (first_weekday + i) % 7 >= 5)
+        return full_weeks * 5 + remaining_days - remaining_weekend
+
+    def _format_date(self, value: datetime) -> str:
+        """Formata uma data como dd/mm/aaaa, reaproveitando formatações anteriores"""
+        day = value.date()
+        label = self._date_labels.get(day)
+        if label is None:
+            label = day.strftime('%d/%m/%Y')
+            self._date_labels[day] = label
+        return label
+
+    def _get_sorted_executors(self) -> List[Executor]:
+        """Retorna os executores únicos de todas as frentes, ordenados por email"""
+        if self._sorted_executors is None:
+            all_executors = set(chain.from_iterable(
+                getattr(self.executors, front.value, []) for front in WorkFront
+            ))
+            self._sorted_executors = sorted(all_executors, key=lambda e: e.email)
+        return self._sorted_executors
+
+    def _get_executor_dayoffs(self, email: str) -> List[DayOff]:
+        """Retorna as ausências de um executor, ignorando maiúsculas/minúsculas no email"""
+        return self._dayoffs_by_email.get(email.lower(), [])
+
+    def _get_user_story_rows(self) -> List[tuple]:
+        """
+        Monta as linhas da tabela de User Stories planejadas
+
+        As linhas são calculadas uma única vez e compartilhadas entre o
+        relatório em Markdown e o PDF.
+
+        Returns:
+            List[tuple]: Tuplas (id, título, responsável, data de finalização, story points)
+        """
+        if self._user_story_rows is None:
+            self._user_story_rows = [
+                (
+                    us.id,
+                    us.title,
+                    us.assignee or '-',
+                    self._format_date(us.end_date) if us.end_date else '-',
+                    str(us.story_points or '-')
+                )
+                for us in self.sprint.user_stories
+            ]
+        return self._user_story_rows
+
+    def _get_executor_capacity_rows(self) -> List[tuple]:
+        """
+        Monta as linhas da tabela de capacity dos executores
+
+        As linhas são calculadas uma única vez e compartilhadas entre o
+        relatório em Markdown e o PDF.
+
+        Returns:
+            List[tuple]: Tuplas (email, capacity total, utilizada, disponível, ausências)
+        """
+        if self._executor_capacity_rows is not None:
+            return self._executor_capacity_rows
+
+        rows = []
+        for executor in self._get_sorted_executors():
+            total = self.metrics.total_capacity.get(executor.email, 0)
+            used = self.metrics.used_capacity.get(executor.email, 0)
+            available = self.metrics.available_capacity.get(executor.email, 0)
+            
+            # Obtém as ausências do executor
+            absences = ', '.join(
+                f"{self._format_date(dayoff.date)} ({_PERIOD_LABELS[dayoff.period]})"
+                for dayoff in self._get_executor_dayoffs(executor.email)
+            )
+
+            rows.append((executor.email, total, used, available, absences or '-'))
+
+        self._executor_capacity_rows = rows
+        return rows
+
+    def _get_capacity_summary(self) -> tuple:
+        """
+        Calcula o resumo de capacity da sprint
+
+        Returns:
+            tuple: (percentual preenchido, total disponível, total utilizado)
+        """
+        if self._capacity_summary is None:
+            # Calcula o total de capacity disponível e utilizada
+            total_available = sum(self.metrics.total_capacity.values())
+            total_used = sum(self.metrics.used_capacity.values())
+            
+            # Calcula o percentual preenchido
+            percent_filled = (total_used / total_available * 100) if total_available > 0 else 0
+            self._capacity_summary = (percent_filled, total_available, total_used)
+        return self._capacity_summary
+
+    def _iter_not_scheduled_tasks(self):
+        """
+        Percorre as tasks não agendadas a partir das colunas das métricas
+
+        Returns:
+            Iterator de tuplas (id, título, motivo, id da User Story)
+        """
+        return zip(
+            self.metrics.not_scheduled_task_ids,
+            self.metrics.not_scheduled_titles,
+            self.metrics.not_scheduled_reasons,
+            self.metrics.not_scheduled_us_ids
+        )
 
     def _generate_markdown(self) -> str:
         """Gera o conteúdo do relatório em Markdown"""
-        report = []
+        buffer = io.StringIO()
+        write = buffer.write
+        writelines = buffer.writelines
         
         # Título
-        report.append(f"# Relatório de Agendamento - Sprint {self.sprint.name}")
-        report.append("")
+        write(f"# Relatório de Agendamento - Sprint {self.sprint.name}\n")
+        write("\n")
         
         # 1. Resumo Geral da Sprint
-        report.append("## 1. Resumo Geral da Sprint")
-        report.append("")
-        report.append(f"- **Sprint:** {self.sprint.name}")
-        report.append(f"- **Início:** {self.sprint.start_date.strftime('%d/%m/%Y')}")
-        report.append(f"- **Término:** {self.sprint.end_date.strftime('%d/%m/%Y')}")
-        report.append(f"- **Total de User Stories:** {len(self.sprint.user_stories)}")
-        report.append("")
+        write("## 1. Resumo Geral da Sprint\n")
+        write("\n")
+        write(f"- **Sprint:** {self.sprint.name}\n")
+        write(f"- **Início:** {self._format_date(self.sprint.start_date)}\n")
+        write(f"- **Término:** {self._format_date(self.sprint.end_date)}\n")
+        write(f"- **Total de User Stories:** {len(self.sprint.user_stories)}\n")
+        write("\n")
         
         # 2. User Stories Planejadas
-        report.append("## 2. User Stories Planejadas")
-        report.append("")
-        report.append("| ID | Título | Responsável | Data de Finalização | Story Points |")
-        report.append("|----|--------|-------------|---------------------|--------------|")
-        
-        for us in self.sprint.user_stories:
-            end_date = us.end_date.strftime('%d/%m/%Y') if us.end_date else '-'
-            report.append(
-                f"| {us.id} | {us.title} | {us.assignee or '-'} | {end_date} | {us.story_points or '-'} |"
-            )
+        write("## 2. User Stories Planejadas\n")
+        write("\n")
+        write("| ID | Título | Responsável | Data de Finalização | Story Points |\n")
+        write("|----|--------|-------------|---------------------|--------------|\n")
+        
+        writelines(
+            f"| {us_id} | {title} | {assignee} | {end_date} | {story_points} |\n"
+            for us_id, title, assignee, end_date, story_points in self._get_user_story_rows()
+        )
         
-        report.append("")
+        write("\n")
         
         # 3. Tasks não planejadas
-        if self.metrics.not_scheduled_tasks:
-            report.append("## 3. Tasks não planejadas")
-            report.append("")
-            report.append("| ID | Título | User Story | Motivo |")
-            report.append("|----|--------|------------|--------|")
+        if self.metrics.not_scheduled_task_ids:
+            write("## 3. Tasks não planejadas\n")
+            write("\n")
+            write("| ID | Título | User Story | Motivo |\n")
+            write("|----|--------|------------|--------|\n")
             
-            for task in self.metrics.not_scheduled_tasks:
-                report.append(
-                    f"| {task['task_id']} | {task['title']} | {task['user_story_id']} | {task['reason']} |"
-                )
-            report.append("")
+            writelines(
+                f"| {task_id} | {title} | {us_id} | {reason} |\n"
+                for task_id, title, reason, us_id in self._iter_not_scheduled_tasks()
+            )
+            write("\n")
             
         # 4. Capacity dos Executores
-        report.append("## 4. Capacity dos Executores")
-        report.append("")
-        report.append("| Executor | Capacity Total | Capacity Utilizada | Capacity Disponível | Datas de Ausência |")
-        report.append("|----------|----------------|-------------------|---------------------|-------------------|")
-        
-        # Obtém todos os executores únicos de todas as frentes
-        all_executors = set()
-        for front in WorkFront:
-            executors_list = getattr(self.executors, front.value, [])
-            all_executors.update(executors_list)
-        
-        # Ordena os executores por email
-        for executor in sorted(all_executors, key=lambda e: e.email):
-            total = self.metrics.total_capacity.get(executor.email, 0)
-            used = self.metrics.used_capacity.get(executor.email, 0)
-            available = self.metrics.available_capacity.get(executor.email, 0)
-            
-            # Obtém as ausências do executor
-            absences = []
-            # Tenta encontrar as ausências ignorando case
-            executor_dayoffs = next((dayoffs for name, dayoffs in self.dayoffs.items() 
-                                  if name.lower() == executor.email.lower()), [])
-            
-            for dayoff in executor_dayoffs:
-                period = {
-                    "full": "dia inteiro",
-                    "morning": "manhã",
-                    "afternoon": "tarde"
-                }
-                absences.append(f"{dayoff.date.strftime('%d/%m/%Y')} ({period[dayoff.period]})")
-            
-            report.append(
-                f"| {executor.email} | {total:.1f}h | {used:.1f}h | {available:.1f}h | {', '.join(absences) or '-'} |"
-            )
+        write("## 4. Capacity dos Executores\n")
+        write("\n")
+        write("| Executor | Capacity Total | Capacity Utilizada | Capacity Disponível | Datas de Ausência |\n")
+        write("|----------|----------------|-------------------|---------------------|-------------------|\n")
+        
+        writelines(
+            f"| {email} | {total:.1f}h | {used:.1f}h | {available:.1f}h | {absences} |\n"
+            for email, total, used, available, absences in self._get_executor_capacity_rows()
+        )
         
-        report.append("")
+        write("\n")
         
         # 5. Percentual de Capacity Preenchida
-        report.append("## 5. Percentual de Capacity Preenchida")
-        report.append("")
-        report.append("| Métrica | Valor |")
-        report.append("|---------|-------|")
-        
-        # Calcula o total de capacity disponível e utilizada
-        total_available = sum(self.metrics.total_capacity.values())
-        total_used = sum(self.metrics.used_capacity.values())
-        
-        # Calcula o percentual preenchido
-        percent_filled = (total_used / total_available * 100) if total_available > 0 else 0
-        
-        report.append(f"| Percentual de Capacity Preenchida | {percent_filled:.2f}% |")
-        report.append(f"| Total de Capacity Disponível | {total_available:.1f}h |")
-        report.append(f"| Total de Capacity Utilizada | {total_used:.1f}h |")
-        report.append("")
-        
-        return "\n".join(report)
-
-    def generate(self) -> None:
-        """Gera o relatório da sprint em PDF, Markdown e Excel"""
-        # Gera o relatório em Markdown
-        markdown_content = self._generate_markdown()
-        markdown_path = self.output_dir / f"relatorio_sprint_{self.sprint.name.replace(' ', '_')}.md"
-        markdown_path.write_text(markdown_content, encoding='utf-8')
-        logger.info(f"Relatório Markdown gerado em {markdown_path}")
-        
-        # Cria o documento PDF
+        write("## 5. Percentual de Capacity Preenchida\n")
+        write("\n")
+        write("| Métrica | Valor |\n")
+        write("|---------|-------|\n")
+        
+        percent_filled, total_available, total_used = self._get_capacity_summary()
+        
+        write(f"| Percentual de Capacity Preenchida | {percent_filled:.2f}% |\n")
+        write(f"| Total de Capacity Disponível | {total_available:.1f}h |\n")
+        write(f"| Total de Capacity Utilizada | {total_used:.1f}h |\n")
+        
+        return buffer.getvalue()
+
+    def generate(self, formats: Optional[Iterable[str]] = None) -> None:
+        """
+        Gera o relatório da sprint nos formatos solicitados
+        
+        Args:
+            formats: Formatos a gerar ("md", "pdf" e/ou "xlsx"); se omitido, gera todos
+        """
+        formats = set(REPORT_FORMATS if formats is None else formats)
+        invalid_formats = formats.difference(REPORT_FORMATS)
+        if invalid_formats:
+            raise ValueError(f"Formatos de relatório inválidos: {', '.join(sorted(invalid_formats))}")
+
+        # Dados compartilhados entre os formatos são calculados antes de dividir o trabalho entre threads
+        self._get_sorted_executors()
+
+        # Dois workers: um grava o Markdown e outro monta o PDF, ambos em segundo
+        # plano enquanto o Excel é montado na thread atual
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            markdown_write = None
+            pdf_build = None
+            if "md" in formats:
+                # Gera o relatório em Markdown
+                markdown_content = self._generate_markdown()
+                markdown_path = self.output_dir / f"relatorio_sprint_{self.sprint.name.replace(' ', '_')}.md"
+                markdown_write = pool.submit(self._write_file, markdown_path, markdown_content.encode('utf-8'))
+
+            if "pdf" in formats:
+                pdf_build = pool.submit(self._generate_pdf)
+
+            if "xlsx" in formats:
+                self._generate_excel()
+
+            if markdown_write is not None:
+                markdown_write.result()
+                logger.info(f"Relatório Markdown gerado em {markdown_path}")
+            if pdf_build is not None:
+                pdf_build.result()
+
+    @staticmethod
+    @contextmanager
+    def _open_output(path: Path) -> Iterator[BinaryIO]:
+        """
+        Abre um arquivo temporário para escrita e o move para o destino ao final,
+        evitando deixar relatórios parcialmente escritos
+        
+        Args:
+            path: Caminho final do arquivo
+        """
+        temp_path = path.with_name(f"{path.name}.tmp")
+        try:
+            with open(temp_path, 'wb', buffering=1 << 20) as handle:
+                yield handle
+        except BaseException:
+            temp_path.unlink(missing_ok=True)
+            raise
+        os.replace(temp_path, path)
+
+    def _write_file(self, path: Path, content: bytes) -> None:
+        """
+        Grava o conteúdo já codificado no arquivo de destino
+        
+        Args:
+            path: Caminho final do arquivo
+            content: Conteúdo já codificado
+        """
+        with self._open_output(path) as handle:
+            handle.write(content)
+
+    def _generate_pdf(self) -> None:
+        """Gera o relatório da sprint em PDF"""
         pdf_path = self.output_dir / f"relatorio_sprint_{self.sprint.name.replace(' ', '_')}.pdf"
-        doc = SimpleDocTemplate(
-            str(pdf_path),
-            pagesize=A4,
-            rightMargin=2*cm,
-            leftMargin=2*cm,
-            topMargin=2*cm,
-            bottomMargin=2*cm
-        )
+        # O ReportLab grava as páginas diretamente no arquivo, sem manter o PDF inteiro em memória
+        with self._open_output(pdf_path) as pdf_file:
+            doc = SimpleDocTemplate(
+                pdf_file,
+                pagesize=A4,
+                rightMargin=2*cm,
+                leftMargin=2*cm,
+                topMargin=2*cm,
+                bottomMargin=2*cm
+            )
+            doc.build(self._build_pdf_elements(doc.width))
+        logger.info(f"Relatório PDF gerado em {pdf_path}")
+
+    def _build_pdf_elements(self, available_width: float) -> List:
+        """
+        Monta os elementos do relatório em PDF
         
+        Args:
+            available_width: Largura útil da página
+            
+        Returns:
+            Lista de flowables do documento
+        """
         # Lista de elementos do documento
         elements = []
+        header_style = self.styles['TableHeader']
+        cell_style = self.styles['TableCell']
+        # Textos informados pelo usuário são escapados antes de virar Paragraph
+        sprint_name = self.sprint.name.translate(_XML_ESCAPE)
         
         # Título
-        elements.append(Paragraph(f"Relatório da Sprint: {self.sprint.name} - {self.team_name}", self.styles['CustomTitle']))
+        elements.append(Paragraph(f"Relatório da Sprint: {sprint_name} - {self.team_name.translate(_XML_ESCAPE)}", self.styles['CustomTitle']))
         elements.append(Spacer(1, 12))
         
         # 1. Resumo Geral da Sprint
         elements.append(Paragraph("1. Resumo Geral da Sprint", self.styles['CustomHeading1']))
-        elements.append(Paragraph(f"Sprint: {self.sprint.name}", self.styles['NormalWrap']))
+        elements.append(Paragraph(f"Sprint: {sprint_name}", self.styles['NormalWrap']))
         elements.append(Paragraph(
-            f"Período: {self.sprint.start_date.strftime('%d/%m/%Y')} a {self.sprint.end_date.strftime('%d/%m/%Y')}",
+            f"Período: {self._format_date(self.sprint.start_date)} a {self._format_date(self.sprint.end_date)}",
             self.styles['NormalWrap']
         ))
         elements.append(Paragraph(f"Total de User Stories planejadas: {len(self.sprint.user_stories)}", self.styles['NormalWrap']))
@@ -320,177 +538,122 @@ class ReportGenerator:
         # 2. User Stories Planejadas
         elements.append(Paragraph("2. User Stories Planejadas", self.styles['CustomHeading1']))
         us_data = [[
-            Paragraph('ID', self.styles['TableHeader']),
-            Paragraph('Título', self.styles['TableHeader']),
-            Paragraph('Responsável', self.styles['TableHeader']),
-            Paragraph('Data de Finalização', self.styles['TableHeader']),
-            Paragraph('Story Points', self.styles['TableHeader'])
+            Paragraph('ID', header_style),
+            Paragraph('Título', header_style),
+            Paragraph('Responsável', header_style),
+            Paragraph('Data de Finalização', header_style),
+            Paragraph('Story Points', header_style)
         ]]
         
-        for us in self.sprint.user_stories:
-            end_date = us.end_date.strftime('%d/%m/%Y') if us.end_date else '-'
+        for us_id, title, assignee, end_date, story_points in self._get_user_story_rows():
             us_data.append([
-                us.id,
-                Paragraph(us.title, self.styles['TableCell']),
-                Paragraph(us.assignee or '-', self.styles['TableCell']),
+                us_id,
+                Paragraph(title.translate(_XML_ESCAPE), cell_style),
+                Paragraph(assignee.translate(_XML_ESCAPE), cell_style),
                 end_date,
-                str(us.story_points or '-')
+                story_points
             ])
         
-        # Calcula larguras proporcionais
-        available_width = doc.width
         us_table = LongTable(
             us_data,
-            colWidths=[
-                available_width * 0.1,  # ID
-                available_width * 0.5,  # Título
-                available_width * 0.15, # Responsável
-                available_width * 0.15, # Data
-                available_width * 0.1   # Story Points
-            ]
+            colWidths=[available_width * ratio for ratio in self._US_COLUMN_RATIOS],
+            repeatRows=1
         )
-        us_table.setStyle(self._create_table_style())
-        elements.append(KeepTogether(us_table))
+        us_table.setStyle(self._table_style)
+        # Pode ocupar várias páginas: sem KeepTogether, o LongTable quebra entre páginas
+        elements.append(us_table)
         elements.append(Spacer(1, 12))
         
         # 3. Tasks não planejadas
-        if self.metrics.not_scheduled_tasks:
+        if self.metrics.not_scheduled_task_ids:
             elements.append(Paragraph("3. Tasks não planejadas", self.styles['CustomHeading1']))
             
             not_scheduled_data = [[
-                Paragraph('ID', self.styles['TableHeader']),
-                Paragraph('Título', self.styles['TableHeader']),
-                Paragraph('User Story', self.styles['TableHeader']),
-                Paragraph('Motivo', self.styles['TableHeader'])
+                Paragraph('ID', header_style),
+                Paragraph('Título', header_style),
+                Paragraph('User Story', header_style),
+                Paragraph('Motivo', header_style)
             ]]
             
-            for task in self.metrics.not_scheduled_tasks:
+            for task_id, title, reason, us_id in self._iter_not_scheduled_tasks():
                 not_scheduled_data.append([
-                    Paragraph(task['task_id'], self.styles['TableCell']),
-                    Paragraph(task['title'], self.styles['TableCell']),
-                    Paragraph(task['user_story_id'], self.styles['TableCell']),
-                    Paragraph(task['reason'], self.styles['TableCell'])
+                    task_id,
+                    Paragraph(title.translate(_XML_ESCAPE), cell_style),
+                    us_id,
+                    Paragraph(reason.translate(_XML_ESCAPE), cell_style)
                 ])
             
             not_scheduled_table = LongTable(
                 not_scheduled_data,
-                colWidths=[
-                    available_width * 0.1,  # ID
-                    available_width * 0.4,  # Título
-                    available_width * 0.2,  # User Story
-                    available_width * 0.3   # Motivo
-                ]
+                colWidths=[available_width * ratio for ratio in self._NOT_SCHEDULED_COLUMN_RATIOS],
+                repeatRows=1
             )
-            not_scheduled_table.setStyle(self._create_table_style())
-            elements.append(KeepTogether(not_scheduled_table))
+            not_scheduled_table.setStyle(self._table_style)
+            elements.append(not_scheduled_table)
             elements.append(Spacer(1, 12))
             
         # 4. Capacity dos Executores
         elements.append(Paragraph("4. Capacity dos Executores", self.styles['CustomHeading1']))
         
         capacity_data = [[
-            Paragraph('Executor', self.styles['TableHeader']),
-            Paragraph('Capacity Total', self.styles['TableHeader']),
-            Paragraph('Capacity Utilizada', self.styles['TableHeader']),
-            Paragraph('Capacity Disponível', self.styles['TableHeader']),
-            Paragraph('Datas de Ausência', self.styles['TableHeader'])
+            Paragraph('Executor', header_style),
+            Paragraph('Capacity Total', header_style),
+            Paragraph('Capacity Utilizada', header_style),
+            Paragraph('Capacity Disponível', header_style),
+            Paragraph('Datas de Ausência', header_style)
         ]]
         
-        # Obtém todos os executores únicos de todas as frentes
-        all_executors = set()
-        for front in WorkFront:
-            executors_list = getattr(self.executors, front.value, [])
-            all_executors.update(executors_list)
-        
-        # Ordena os executores por email
-        for executor in sorted(all_executors, key=lambda e: e.email):
-            total = self.metrics.total_capacity.get(executor.email, 0)
-            used = self.metrics.used_capacity.get(executor.email, 0)
-            available = self.metrics.available_capacity.get(executor.email, 0)
-            
-            # Obtém as ausências do executor
-            absences = []
-            # Tenta encontrar as ausências ignorando case
-            executor_dayoffs = next((dayoffs for name, dayoffs in self.dayoffs.items() 
-                                  if name.lower() == executor.email.lower()), [])
-            
-            for dayoff in executor_dayoffs:
-                period = {
-                    "full": "dia inteiro",
-                    "morning": "manhã",
-                    "afternoon": "tarde"
-                }
-                absences.append(f"{dayoff.date.strftime('%d/%m/%Y')} ({period[dayoff.period]})")
-            
+        for email, total, used, available, absences in self._get_executor_capacity_rows():
             capacity_data.append([
-                Paragraph(executor.email, self.styles['TableCell']),
-                Paragraph(f"{total:.1f}h", self.styles['TableCell']),
-                Paragraph(f"{used:.1f}h", self.styles['TableCell']),
-                Paragraph(f"{available:.1f}h", self.styles['TableCell']),
-                Paragraph(', '.join(absences) or '-', self.styles['TableCell'])
+                Paragraph(email.translate(_XML_ESCAPE), cell_style),
+                f"{total:.1f}h",
+                f"{used:.1f}h",
+                f"{available:.1f}h",
+                Paragraph(absences, cell_style)
             ])
         
         capacity_table = LongTable(
             capacity_data,
-            colWidths=[
-                available_width * 0.25,  # Executor
-                available_width * 0.15,  # Capacity Total
-                available_width * 0.15,  # Capacity Utilizada
-                available_width * 0.15,  # Capacity Disponível
-                available_width * 0.3    # Datas de Ausência
-            ]
+            colWidths=[available_width * ratio for ratio in self._CAPACITY_COLUMN_RATIOS],
+            repeatRows=1
         )
-        capacity_table.setStyle(self._create_table_style())
-        elements.append(KeepTogether(capacity_table))
+        capacity_table.setStyle(self._table_style)
+        elements.append(capacity_table)
         elements.append(Spacer(1, 12))
         
         # 5. Percentual de Capacity Preenchida
         elements.append(Paragraph("5. Percentual de Capacity Preenchida", self.styles['CustomHeading1']))
         
-        # Calcula o total de capacity disponível e utilizada
-        total_available = sum(self.metrics.total_capacity.values())
-        total_used = sum(self.metrics.used_capacity.values())
-        
-        # Calcula o percentual preenchido
-        percent_filled = (total_used / total_available * 100) if total_available > 0 else 0
+        percent_filled, total_available, total_used = self._get_capacity_summary()
         
         capacity_summary_data = [[
-            Paragraph('Métrica', self.styles['TableHeader']),
-            Paragraph('Valor', self.styles['TableHeader'])
+            Paragraph('Métrica', header_style),
+            Paragraph('Valor', header_style)
         ]]
         
+        # Células curtas, sem quebra de linha, dispensam o Paragraph
         capacity_summary_data.extend([
-            [Paragraph('Percentual de Capacity Preenchida', self.styles['TableCell']),
-             Paragraph(f"{percent_filled:.2f}%", self.styles['TableCell'])],
-            [Paragraph('Total de Capacity Disponível', self.styles['TableCell']),
-             Paragraph(f"{total_available:.1f}h", self.styles['TableCell'])],
-            [Paragraph('Total de Capacity Utilizada', self.styles['TableCell']),
-             Paragraph(f"{total_used:.1f}h", self.styles['TableCell'])]
+            ['Percentual de Capacity Preenchida', f"{percent_filled:.2f}%"],
+            ['Total de Capacity Disponível', f"{total_available:.1f}h"],
+            ['Total de Capacity Utilizada', f"{total_used:.1f}h"]
         ])
         
         capacity_summary_table = LongTable(
             capacity_summary_data,
-            colWidths=[
-                available_width * 0.6,  # Métrica
-                available_width * 0.4   # Valor
-            ]
+            colWidths=[available_width * ratio for ratio in self._CAPACITY_SUMMARY_COLUMN_RATIOS],
+            repeatRows=1
         )
-        capacity_summary_table.setStyle(self._create_table_style())
+        capacity_summary_table.setStyle(self._table_style)
         elements.append(KeepTogether(capacity_summary_table))
         elements.append(Spacer(1, 12))
         
-        # Gera o PDF
-        doc.build(elements)
-        logger.info(f"Relatório PDF gerado em {pdf_path}")
-        
-        # Gera o relatório em Excel
-        self._generate_excel()
+        return elements
 
     def _generate_excel(self) -> None:
         """Gera o relatório da sprint em Excel"""
-        wb = openpyxl.Workbook()
-        ws = wb.active
-        ws.title = f"Sprint {self.sprint.name}"
+        # Modo write_only: as linhas são gravadas em sequência, sem manter as células em memória
+        wb = openpyxl.Workbook(write_only=True)
+        ws = wb.create_sheet(f"Sprint {self.sprint.name}")
 
         sprint_start = self.sprint.start_date
         sprint_end = self.sprint.end_date
@@ -499,153 +662,127 @@ class ReportGenerator:
         if sprint_end.tzinfo is None:
             sprint_end = sprint_end.replace(tzinfo=timezone.utc)
 
-        all_executors = set()
-        for front in WorkFront:
-            executors_list = getattr(self.executors, front.value, [])
-            all_executors.update(executors_list)
-        sorted_executors = sorted(all_executors, key=lambda e: e.email)
+        sorted_executors = self._get_sorted_executors()
 
         num_date_columns = (sprint_end - sprint_start).days + 1
         last_col = num_date_columns + 1
-        last_col_letter = get_column_letter(last_col)
+        col_letters = get_column_interval(1, last_col)
+        last_col_letter = col_letters[-1]
+
+        # Datas da sprint, dias e fins de semana calculados uma única vez para todos os executores
+        sprint_dates = [sprint_start + timedelta(days=i) for i in range(num_date_columns)]
+        sprint_days = [d.date() for d in sprint_dates]
+        weekends = [d.weekday() >= 5 for d in sprint_dates]
 
         # Bordas
         medium = Side(style='medium')
         thin = Side(style='thin')
         none = Side(style=None)
 
+        # Largura das colunas e linhas de grade precisam ser definidas antes da primeira linha
         # Largura fixa para todas as colunas (inclusive datas e label)
         col_width = 15
-        for col in range(1, last_col + 1):
-            ws.column_dimensions[get_column_letter(col)].width = col_width
+        for col_letter in col_letters:
+            ws.column_dimensions[col_letter].width = col_width
 
+        # Desabilitar linhas de grade
+        ws.sheet_view.showGridLines = False
+
+        # Estilos reaproveitados por todas as células (os objetos de estilo do openpyxl são imutáveis)
+        bold = Font(bold=True)
+        center = Alignment(horizontal='center')
+        # O bloco do executor tem borda média externa; e-mail, linha vazia e labels
+        # não recebem borda interna, enquanto datas e períodos recebem borda interna fina
+        email_borders = self._excel_row_borders(
+            Border(left=medium, right=none, top=medium, bottom=none), last_col, none, none, medium, none, medium
+        )
+        empty_borders = self._excel_row_borders(
+            Border(left=medium, right=none, top=none, bottom=none), last_col, thin, thin, none, thin, medium
+        )
+        date_borders = self._excel_row_borders(
+            Border(left=medium, right=thin, top=none, bottom=none), last_col, thin, thin, thin, thin, medium
+        )
+        morning_borders = self._excel_row_borders(
+            Border(left=medium, right=none, top=none, bottom=none), last_col, thin, thin, thin, thin, medium
+        )
+        afternoon_borders = self._excel_row_borders(
+            Border(left=medium, right=none, top=none, bottom=medium), last_col, thin, thin, thin, medium, medium
+        )
+
+        # A primeira linha da planilha fica vazia
+        ws.append([])
         current_row = 2
         for executor in sorted_executors:
-            bloco_inicio = current_row
-            bloco_fim = current_row + 4  # email, vazia, datas, manhã, tarde
+            # Ausências do executor indexadas pelo dia (mantém a primeira ocorrência)
+            dayoffs_by_day = {d.date.date(): d for d in reversed(self._get_executor_dayoffs(executor.email))}
+            # Horas alocadas por dia nos períodos da manhã e da tarde
+            allocations = self._get_period_allocations(executor.email, sprint_days[0], sprint_days[-1])
 
             # Linha 1: Email do executor (mesclado de A até última data)
-            ws.merge_cells(f'A{current_row}:{last_col_letter}{current_row}')
-            ws.cell(row=current_row, column=1, value=executor.email)
-            ws.cell(row=current_row, column=1).font = Font(bold=True)
-            ws.cell(row=current_row, column=1).alignment = Alignment(horizontal='center')
+            ws.merged_cells.add(f'A{current_row}:{last_col_letter}{current_row}')
+            row_cells = [self._excel_cell(ws, border=border) for border in email_borders]
+            row_cells[0].value = executor.email
+            row_cells[0].font = bold
+            row_cells[0].alignment = center
+            ws.append(row_cells)
             current_row += 1
 
             # Linha 2: Vazia (mesclada de A até última data)
-            ws.merge_cells(f'A{current_row}:{last_col_letter}{current_row}')
+            ws.merged_cells.add(f'A{current_row}:{last_col_letter}{current_row}')
+            ws.append([self._excel_cell(ws, border=border) for border in empty_borders])
             current_row += 1
 
             # Linha 3: Datas (A vazia, datas de B em diante)
-            ws.cell(row=current_row, column=1, value=None)
-            ws.cell(row=current_row, column=1).alignment = Alignment(horizontal='center')
-            current_date = sprint_start
-            for col in range(2, last_col + 1):
-                excel_date = current_date.replace(tzinfo=None)
-                cell = ws.cell(row=current_row, column=col, value=excel_date)
-                cell.number_format = 'dd/mm/yyyy'
-                cell.alignment = Alignment(horizontal='center')
-                current_date += timedelta(days=1)
+            row_cells = [self._excel_cell(ws, alignment=center, border=date_borders[0])]
+            for col, current_date in enumerate(sprint_dates, start=2):
+                row_cells.append(self._excel_cell(
+                    ws, current_date.replace(tzinfo=None),
+                    number_format='dd/mm/yyyy',
+                    alignment=center,
+                    border=date_borders[col - 1]
+                ))
+            ws.append(row_cells)
             current_row += 1
 
             # Linha 4: Manhã
-            ws.cell(row=current_row, column=1, value="Manhã")
-            ws.cell(row=current_row, column=1).font = Font(bold=True)
-            ws.cell(row=current_row, column=1).alignment = Alignment(horizontal='center')
-            current_date = sprint_start
-            for col in range(2, last_col + 1):
-                is_weekend = current_date.weekday() >= 5
-                executor_dayoffs = next((dayoffs for name, dayoffs in self.dayoffs.items() if name.lower() == executor.email.lower()), [])
-                dayoff = next((d for d in executor_dayoffs if d.date.date() == current_date.date()), None)
-                morning_allocation = self._calculate_period_allocation(
-                    executor.email, current_date, self.morning_start, self.morning_end
-                )
-                cell = ws.cell(row=current_row, column=col)
+            row_cells = [self._excel_cell(ws, "Manhã", font=bold, alignment=center, border=morning_borders[0])]
+            for col, (day, is_weekend) in enumerate(zip(sprint_days, weekends), start=2):
+                dayoff = dayoffs_by_day.get(day)
+                morning_allocation = allocations.get(day, _NO_ALLOCATION)[0]
+                cell = self._excel_cell(ws, border=morning_borders[col - 1])
                 if is_weekend:
                     cell.fill = self.excel_colors['weekend']
                 elif dayoff and dayoff.period in ['full', 'morning']:
                     cell.fill = self.excel_colors['dayoff']
                 else:
                     self._apply_allocation_color(cell, morning_allocation)
-                current_date += timedelta(days=1)
+                row_cells.append(cell)
+            ws.append(row_cells)
             current_row += 1
 
             # Linha 5: Tarde
-            ws.cell(row=current_row, column=1, value="Tarde")
-            ws.cell(row=current_row, column=1).font = Font(bold=True)
-            ws.cell(row=current_row, column=1).alignment = Alignment(horizontal='center')
-            current_date = sprint_start
-            for col in range(2, last_col + 1):
-                is_weekend = current_date.weekday() >= 5
-                executor_dayoffs = next((dayoffs for name, dayoffs in self.dayoffs.items() if name.lower() == executor.email.lower()), [])
-                dayoff = next((d for d in executor_dayoffs if d.date.date() == current_date.date()), None)
-                afternoon_allocation = self._calculate_period_allocation(
-                    executor.email, current_date, self.afternoon_start, self.afternoon_end
-                )
-                cell = ws.cell(row=current_row, column=col)
+            row_cells = [self._excel_cell(ws, "Tarde", font=bold, alignment=center, border=afternoon_borders[0])]
+            for col, (day, is_weekend) in enumerate(zip(sprint_days, weekends), start=2):
+                dayoff = dayoffs_by_day.get(day)
+                afternoon_allocation = allocations.get(day, _NO_ALLOCATION)[1]
+                cell = self._excel_cell(ws, border=afternoon_borders[col - 1])
                 if is_weekend:
                     cell.fill = self.excel_colors['weekend']
                 elif dayoff and dayoff.period in ['full', 'afternoon']:
                     cell.fill = self.excel_colors['dayoff']
                 else:
                     self._apply_allocation_color(cell, afternoon_allocation)
-                current_date += timedelta(days=1)
+                row_cells.append(cell)
+            ws.append(row_cells)
             current_row += 1
 
-            # Aplicar borda média externa ao bloco do executor (inclui email, vazia, datas, manhã, tarde)
-            for row in range(bloco_inicio, bloco_fim + 1):
-                for col in range(1, last_col + 1):
-                    cell = ws.cell(row=row, column=col)
-                    # Borda externa média somente nas extremidades do bloco
-                    left = medium if col == 1 else none
-                    right = medium if col == last_col else none
-                    top = medium if row == bloco_inicio else none
-                    bottom = medium if row == bloco_fim else none
-
-                    # Células de e-mail e labels não recebem borda interna
-                    if (row in (bloco_inicio, bloco_inicio + 1, bloco_inicio + 3, bloco_inicio + 4) and col == 1) or (row == bloco_inicio and col > 1):
-                        cell.border = Border(left=left, right=right, top=top, bottom=bottom)
-                    # Células de datas e períodos recebem borda interna fina
-                    else:
-                        cell.border = Border(
-                            left=left if left != none else thin,
-                            right=right if right != none else thin,
-                            top=top if top != none else thin,
-                            bottom=bottom if bottom != none else thin
-                        )
-
-            # --- REGRAS EXTRAS PARA GARANTIR O VISUAL ---
-            # 1. Remover borda inferior da linha do e-mail (todas as células)
-            for col in range(1, last_col + 1):
-                cell = ws.cell(row=bloco_inicio, column=col)
-                b = cell.border
-                cell.border = Border(
-                    left=b.left, right=b.right, top=b.top, bottom=none
-                )
-            # 2. Remover borda superior da linha vazia (todas as células)
-            for col in range(1, last_col + 1):
-                cell = ws.cell(row=bloco_inicio + 1, column=col)
-                b = cell.border
-                cell.border = Border(
-                    left=b.left, right=b.right, top=none, bottom=b.bottom
-                )
-            # 3. Remover borda superior e inferior das células da coluna A entre o topo do bloco e a label 'Manhã'
-            for row in (bloco_inicio + 1, bloco_inicio + 2):
-                cell = ws.cell(row=row, column=1)
-                b = cell.border
-                cell.border = Border(
-                    left=b.left, right=b.right, top=none, bottom=none
-                )
-            # 4. Remover borda superior da label 'Manhã'
-            cell = ws.cell(row=bloco_inicio + 3, column=1)
-            b = cell.border
-            cell.border = Border(
-                left=b.left, right=b.right, top=none, bottom=b.bottom
-            )
-
             # Espaçamento entre executores
+            ws.append([])
+            ws.append([])
             current_row += 2
 
         # Legenda como bloco mesclado com borda média
+        ws.append([])
         legend_row = current_row + 1
         legend_last_col = 4
         legend_last_col_letter = get_column_letter(legend_last_col)
@@ -656,84 +793,121 @@ class ReportGenerator:
             ("Alocação Parcial (>0h)", self.excel_colors['partial']),
             ("Sem Alocação", self.excel_colors['empty'])
         ]
-        ws.merge_cells(f'A{legend_row}:{legend_last_col_letter}{legend_row}')
-        ws.cell(row=legend_row, column=1, value="Legenda:")
-        ws.cell(row=legend_row, column=1).font = Font(bold=True)
-        for i, (label, color) in enumerate(legend_items):
-            row = legend_row + i + 1
-            ws.merge_cells(f'A{row}:C{row}')
-            ws.cell(row=row, column=1, value=label)
-            ws.cell(row=row, column=4).fill = color
-        # Borda média ao redor do bloco da legenda
-        for row in range(legend_row, legend_row + len(legend_items) + 1):
-            for col in range(1, legend_last_col + 1):
-                cell = ws.cell(row=row, column=col)
-                left = medium if col == 1 else none
-                right = medium if col == legend_last_col else none
-                top = medium if row == legend_row else none
-                bottom = medium if row == legend_row + len(legend_items) else none
-                cell.border = Border(
-                    left=left if left != none else thin,
-                    right=right if right != none else thin,
-                    top=top if top != none else thin,
-                    bottom=bottom if bottom != none else thin
-                )
-
-        # Desabilitar linhas de grade
-        ws.sheet_view.showGridLines = False
+        legend_last_row = legend_row + len(legend_items)
+        # Borda média ao redor do bloco da legenda e fina entre as células
+        legend_borders = {
+            top_bottom: self._excel_row_borders(
+                Border(left=medium, right=thin, top=top_bottom[0], bottom=top_bottom[1]),
+                legend_last_col, thin, thin, top_bottom[0], top_bottom[1], medium
+            )
+            for top_bottom in ((medium, thin), (thin, thin), (thin, medium))
+        }
+        ws.merged_cells.add(f'A{legend_row}:{legend_last_col_letter}{legend_row}')
+        for i, (label, color) in enumerate([("Legenda:", None)] + legend_items):
+            row = legend_row + i
+            if i:
+                ws.merged_cells.add(f'A{row}:C{row}')
+            top_bottom = (
+                medium if row == legend_row else thin,
+                medium if row == legend_last_row else thin
+            )
+            row_cells = [self._excel_cell(ws, border=border) for border in legend_borders[top_bottom]]
+            row_cells[0].value = label
+            if color is None:
+                row_cells[0].font = bold
+            else:
+                row_cells[-1].fill = color
+            ws.append(row_cells)
 
         excel_path = self.output_dir / f"relatorio_sprint_{self.sprint.name.replace(' ', '_')}.xlsx"
-        wb.save(str(excel_path))
+        with self._open_output(excel_path) as excel_file:
+            wb.save(excel_file)
         logger.info(f"Relatório Excel gerado em {excel_path}")
 
-    def _calculate_period_allocation(self, executor_email: str, date: datetime, start_time: time, end_time: time) -> float:
+    @staticmethod
+    def _excel_row_borders(first: Border, last_col: int, left: Side, right: Side, top: Side, bottom: Side, last_right: Side) -> List[Border]:
+        """
+        Monta as bordas de uma linha da planilha, uma por coluna
+        
+        Args:
+            first: Borda da coluna A
+            last_col: Índice da última coluna
+            left, right, top, bottom: Lados das bordas das colunas intermediárias
+            last_right: Lado direito da borda da última coluna
+        """
+        inner = Border(left=left, right=right, top=top, bottom=bottom)
+        last = Border(left=left, right=last_right, top=top, bottom=bottom)
+        return [first] + [inner] * (last_col - 2) + [last]
+
+    @staticmethod
+    def _excel_cell(ws, value=None, **styles) -> WriteOnlyCell:
         """
-        Calcula a alocação de um executor em um período específico
+        Cria uma célula da planilha em modo write_only com os estilos informados
+        
+        Args:
+            ws: Planilha em modo write_only
+            value: Valor da célula
+            **styles: Atributos de estilo (font, alignment, border, fill, number_format)
+        """
+        cell = WriteOnlyCell(ws, value=value)
+        for name, style in styles.items():
+            setattr(cell, name, style)
+        return cell
+
+    def _get_period_allocations(self, executor_email: str, first_day: date, last_day: date) -> Dict[date, List[float]]:
+        """
+        Calcula as horas alocadas de um executor em cada dia da sprint, separadas
+        nos períodos da manhã e da tarde, com uma única passada pelas tasks
         
         Args:
             executor_email: Email do executor
-            date: Data a ser verificada
-            start_time: Horário de início do período
-            end_time: Horário de fim do período
+            first_day: Primeiro dia considerado
+            last_day: Último dia considerado
             
         Returns:
-            float: Horas alocadas no período
+            Dict[date, List[float]]: Horas alocadas [manhã, tarde] por dia; dias sem alocação não aparecem
         """
         # Obtém todas as tasks do executor
         tasks = self.sprint.get_tasks_by_assignee(executor_email)
-        logger.info(f"Calculando alocação para {executor_email} em {date.date()} {start_time}-{end_time}")
-        logger.info(f"Total de tasks encontradas: {len(tasks)}")
-        
-        # Filtra apenas tasks ativas
-        active_tasks = [t for t in tasks if t.status not in [TaskStatus.CLOSED, TaskStatus.CANCELLED]]
-        logger.info(f"Tasks ativas: {len(active_tasks)}")
-        
-        # Calcula horas alocadas no período
-        allocated_hours = 0
-        for task in active_tasks:
-            if task.start_date and task.end_date:
-                # Ajusta datas das tasks para o timezone correto
-                task_start = task.start_date.astimezone(self.timezone)
-                task_end = task.end_date.astimezone(self.timezone)
-                
-                # Verifica se a task está no dia
-                if task_start.date() <= date.date() <= task_end.date():
-                    # Calcula sobreposição com o período
-                    period_start = datetime.combine(date.date(), start_time, tzinfo=self.timezone)
-                    period_end = datetime.combine(date.date(), end_time, tzinfo=self.timezone)
-                    
-                    # Ajusta as datas para considerar apenas o período de trabalho
-                    period_start = max(period_start, task_start)
-                    period_end = min(period_end, task_end)
-                    
-                    if period_start < period_end:
-                        # Calcula horas sobrepostas
-                        overlap_hours = (period_end - period_start).total_seconds() / 3600
-                        allocated_hours += overlap_hours
-                        logger.info(f"Task {task.id}: {overlap_hours:.1f}h alocadas (início: {task_start}, fim: {task_end})")
-        
-        logger.info(f"Total alocado: {allocated_hours:.1f}h")
-        return allocated_hours
+        logger.info(f"Calculando alocação para {executor_email}: {len(tasks)} tasks encontradas")
+        
+        tz = self.timezone
+        periods = ((_MORNING_START, _MORNING_END), (_AFTERNOON_START, _AFTERNOON_END))
+        allocations: Dict[date, List[float]] = {}
+        # Limites dos períodos de cada dia em segundos POSIX, compartilhados entre as tasks
+        period_bounds: Dict[date, tuple] = {}
+        for task in tasks:
+            # Considera apenas tasks ativas e com datas definidas
+            if task.status in _INACTIVE_STATUSES:
+                continue
+            if not (task.start_date and task.end_date):
+                continue
+
+            # Dias da task no timezone correto; a sobreposição é calculada sobre timestamps,
+            # que independem do timezone
+            task_start = task.start_date.timestamp()
+            task_end = task.end_date.timestamp()
+
+            # Percorre apenas os dias da task que estão dentro do intervalo
+            day = max(task.start_date.astimezone(tz).date(), first_day)
+            task_last_day = min(task.end_date.astimezone(tz).date(), last_day)
+            while day <= task_last_day:
+                bounds = period_bounds.get(day)
+                if bounds is None:
+                    bounds = period_bounds[day] = tuple(
+                        (datetime.combine(day, start_time, tzinfo=tz).timestamp(),
+                         datetime.combine(day, end_time, tzinfo=tz).timestamp())
+                        for start_time, end_time in periods
+                    )
+                for index, (period_start, period_end) in enumerate(bounds):
+                    # Considera apenas a parte da task dentro do período de trabalho
+                    overlap = min(period_end, task_end) - max(period_start, task_start)
+                    if overlap > 0:
+                        # Acumula as horas sobrepostas
+                        allocations.setdefault(day, [0, 0])[index] += overlap / 3600
+                day += timedelta(days=1)
+
+        return allocations
 
     def _apply_allocation_color(self, cell, allocation: float) -> None:
         """
@@ -8,6 +8,7 @@ from ..models.entities import (
     WorkFront,
     TaskStatus,
     SprintMetrics,
+    hours_to_story_points,
 )
 from ..models.config import DayOff, ExecutorsConfig, Executor
 import random
@@ -47,6 +48,10 @@ class SprintScheduler:
         # Usa o objeto SprintMetrics existente na Sprint
         self.metrics = sprint.metrics
 
+        # Índices de tasks por executor (email em lowercase) e por ID, mantidos durante schedule()
+        self._tasks_by_assignee: Optional[Dict[str, List[Task]]] = None
+        self._tasks_by_id: Optional[Dict[str, Task]] = None
+
         # Inicializa o dicionário de capacity atual dos executores
         self._initialize_executor_capacity()
 
@@ -130,40 +135,87 @@ class SprintScheduler:
             tzinfo=self.timezone,
         )
 
+    def _build_assignee_index(self) -> Dict[str, List[Task]]:
+        """Constrói o índice de tasks da sprint por executor"""
+        index: Dict[str, List[Task]] = {}
+        for us in self.sprint.user_stories:
+            for task in us.tasks:
+                if task.assignee:
+                    index.setdefault(task.assignee.lower(), []).append(task)
+        self._tasks_by_assignee = index
+        return index
+
+    def _get_tasks_by_assignee(self, assignee: str) -> List[Task]:
+        """Retorna as tasks da sprint atribuídas a um executor"""
+        index = self._tasks_by_assignee
+        if index is None:
+            # Fora de schedule() as tasks podem mudar entre as chamadas
+            return self.sprint.get_tasks_by_assignee(assignee)
+        return index.get(assignee.lower(), [])
+
+    def _get_task(self, task_id: str) -> Optional[Task]:
+        """Retorna a task da sprint com o ID informado ou None se não existir"""
+        index = self._tasks_by_id
+        if index is None:
+            return next((t for t in self.sprint.get_all_tasks() if t.id == task_id), None)
+        return index.get(task_id)
+
+    def _set_task_assignee(self, task: Task, assignee: Optional[str]) -> None:
+        """Atribui um executor à task mantendo o índice por executor atualizado"""
+        index = self._tasks_by_assignee
+        if index is not None:
+            if task.assignee:
+                current = index.get(task.assignee.lower(), [])
+                for position, indexed_task in enumerate(current):
+                    if indexed_task is task:
+                        del current[position]
+                        break
+            if assignee:
+                index.setdefault(assignee.lower(), []).append(task)
+        task.assignee = assignee
+
     def schedule(self) -> None:
         """Agenda todas as tasks da sprint"""
+        # Durante o agendamento as tasks da sprint não mudam e toda reatribuição
+        # passa pelo agendador, então os índices podem ser mantidos
+        self._build_assignee_index()
+        self._tasks_by_id = {t.id: t for us in self.sprint.user_stories for t in us.tasks}
+        try:
+            self._schedule_sprint()
+        finally:
+            self._tasks_by_assignee = None
+            self._tasks_by_id = None
+
+    def _schedule_sprint(self) -> None:
+        """Agenda as User Stories e, em seguida, as tasks que ficaram bloqueadas"""
         logger.info(f"Iniciando agendamento da sprint {self.sprint.name}")
 
         # Primeiro agenda todas as User Stories
         for us in self.sprint.user_stories:
             self._schedule_user_story(us)
 
-        # Coleta todas as tasks bloqueadas da sprint
+        # Coleta todas as tasks bloqueadas da sprint junto com a User Story de
+        # cada uma, evitando buscá-la novamente na lista de User Stories
         blocked_tasks = []
         blocked_qa_plan_tasks = []
         for us in self.sprint.user_stories:
             for task in us.tasks:
                 if task.status == TaskStatus.BLOCKED:
-                    blocked_tasks.append(task)
+                    blocked_tasks.append((task, us))
                 elif task.is_qa_test_plan and task.status != TaskStatus.SCHEDULED:
-                    blocked_qa_plan_tasks.append(task)
+                    blocked_qa_plan_tasks.append((task, us))
 
         # Tenta agendar as tasks bloqueadas após todas as User Stories
         if blocked_tasks:
             logger.info(
                 f"Tentando agendar {len(blocked_tasks)} tasks bloqueadas após todas as User Stories"
             )
-            for task in blocked_tasks:
+            for task, us in blocked_tasks:
                 if self._schedule_task(task):
                     logger.info(
                         f"Task {task.id} desbloqueada após agendamento de todas as User Stories"
                     )
                     # Tenta atualizar a User Story após desbloquear a task
-                    us = next(
-                        us
-                        for us in self.sprint.user_stories
-                        if us.id == task.parent_user_story_id
-                    )
                     self._try_update_user_story(us)
                 else:
                     logger.warning(
@@ -175,12 +227,7 @@ class SprintScheduler:
             logger.info(
                 f"Tentando agendar {len(blocked_qa_plan_tasks)} tasks de plano de testes após desbloqueio de outras tasks"
             )
-            for task in blocked_qa_plan_tasks:
-                us = next(
-                    us
-                    for us in self.sprint.user_stories
-                    if us.id == task.parent_user_story_id
-                )
+            for task, us in blocked_qa_plan_tasks:
                 self._schedule_qa_plan_task(task, us)
                 if task.status == TaskStatus.SCHEDULED:
                     logger.info(
@@ -395,27 +442,8 @@ class SprintScheduler:
             t.estimated_hours for t in scheduled_tasks if t.estimated_hours
         )
 
-        # Tabela de conversão de horas para story points conforme regras
-        if total_estimated_hours <= 1:
-            us.story_points = 0.5
-        elif total_estimated_hours <= 2:
-            us.story_points = 1
-        elif total_estimated_hours <= 3:
-            us.story_points = 2
-        elif total_estimated_hours <= 5:
-            us.story_points = 3
-        elif total_estimated_hours <= 9:
-            us.story_points = 5
-        elif total_estimated_hours <= 14:
-            us.story_points = 8
-        elif total_estimated_hours <= 23:
-            us.story_points = 13
-        elif total_estimated_hours <= 37:
-            us.story_points = 21
-        elif total_estimated_hours <= 60:
-            us.story_points = 34
-        else:
-            us.story_points = 55
+        # Converte as horas em story points conforme a tabela de regras
+        us.story_points = hours_to_story_points(total_estimated_hours)
 
         logger.info(
             f"User Story {us.id} atualizada: "
@@ -467,7 +495,7 @@ class SprintScheduler:
 
         # Atribui executor se necessário
         if not task.assignee:
-            task.assignee = self._get_best_executor(task)
+            self._set_task_assignee(task, self._get_best_executor(task))
 
         if not task.assignee:
             logger.error(f"Não foi possível encontrar executor para task {task.id}")
@@ -570,7 +598,7 @@ class SprintScheduler:
 
         # Atribui executor se necessário
         if not task.assignee:
-            task.assignee = self._get_best_executor(task)
+            self._set_task_assignee(task, self._get_best_executor(task))
 
         if not task.assignee:
             logger.error(
@@ -684,7 +712,7 @@ class SprintScheduler:
 
         # Atribui executor se necessário
         if not task.assignee:
-            task.assignee = self._get_best_executor(task)
+            self._set_task_assignee(task, self._get_best_executor(task))
 
         if not task.assignee:
             logger.error(
@@ -810,15 +838,12 @@ class SprintScheduler:
         if not task.dependencies:
             return True
 
-        all_tasks = self.sprint.get_all_tasks()
-        task_dict = {t.id: t for t in all_tasks}
-
         for dep_id in task.dependencies:
-            if dep_id not in task_dict:
+            dep_task = self._get_task(dep_id)
+            if dep_task is None:
                 logger.error(f"Dependência {dep_id} não encontrada")
                 return False
 
-            dep_task = task_dict[dep_id]
             if dep_task.status != TaskStatus.SCHEDULED:
                 return False
 
@@ -859,11 +884,11 @@ class SprintScheduler:
                 >= task.estimated_hours
             ):
                 # Tenta agendar com o executor atual
-                task.assignee = current_executor
+                self._set_task_assignee(task, current_executor)
                 if self._try_schedule_task(task):
                     return current_executor
                 # Se não conseguiu agendar, remove o executor e continua com os outros
-                task.assignee = None
+                self._set_task_assignee(task, None)
 
         # Randomiza a ordem dos executores para evitar sempre o mesmo primeiro
         executors_list = executors_list[:]
@@ -877,12 +902,12 @@ class SprintScheduler:
                 continue
 
             # Tenta agendar com este executor
-            task.assignee = executor.email
+            self._set_task_assignee(task, executor.email)
             if self._try_schedule_task(task):
                 return executor.email
 
             # Se não conseguiu agendar, remove o executor e continua com os outros
-            task.assignee = None
+            self._set_task_assignee(task, None)
 
         # Se chegou aqui, não conseguiu agendar com nenhum executor
         return None
@@ -986,7 +1011,7 @@ class SprintScheduler:
         # Pega todas as tasks já agendadas do executor
         executor_tasks = [
             t
-            for t in self.sprint.get_tasks_by_assignee(task.assignee)
+            for t in self._get_tasks_by_assignee(task.assignee)
             if t.status == TaskStatus.SCHEDULED  # Considera apenas tasks já agendadas
             and t.end_date is not None
             and t.id != task.id
@@ -1075,13 +1100,11 @@ class SprintScheduler:
         if not task.dependencies:
             return None
 
-        all_tasks = self.sprint.get_all_tasks()
-        task_dict = {t.id: t for t in all_tasks}
         dep_dates = []
 
         for dep_id in task.dependencies:
-            if dep_id in task_dict and task_dict[dep_id].end_date:
-                dep_task = task_dict[dep_id]
+            dep_task = self._get_task(dep_id)
+            if dep_task and dep_task.end_date:
                 dep_dates.append(dep_task.end_date)
                 logger.info(
                     f"Task {task.id} depende da task {dep_id} que termina em {dep_task.end_date}"
@@ -1124,7 +1147,7 @@ class SprintScheduler:
         # Pega todas as tasks já agendadas do executor
         executor_tasks = [
             t
-            for t in self.sprint.get_tasks_by_assignee(task.assignee)
+            for t in self._get_tasks_by_assignee(task.assignee)
             if t.status == TaskStatus.SCHEDULED
             and t.end_date is not None
             and t.id != task.id
@@ -1291,18 +1314,15 @@ class SprintScheduler:
         if date.weekday() >= 5:
             return False
 
-        # Normaliza a data para YYYY-MM-DD
-        normalized_date = date.strftime("%Y-%m-%d")
+        # Compara apenas o dia, sem formatar as datas como texto
+        current_day = date.date()
         current_time = date.time()
 
         # Verifica se tem ausência (usando email em lowercase)
         executor_dayoffs = self.dayoffs.get(executor.lower(), [])
         for dayoff in executor_dayoffs:
-            # Normaliza a data do dayoff para YYYY-MM-DD
-            normalized_dayoff_date = dayoff.date.strftime("%Y-%m-%d")
-
             # Se não é o mesmo dia, continua verificando
-            if normalized_dayoff_date != normalized_date:
+            if dayoff.date.date() != current_day:
                 continue
 
             # Se é ausência dia inteiro, retorna False
@@ -1347,7 +1367,7 @@ class SprintScheduler:
 
         # Atribui executor se necessário
         if not task.assignee:
-            task.assignee = self._get_best_executor(task)
+            self._set_task_assignee(task, self._get_best_executor(task))
 
         if not task.assignee:
             logger.error(f"Não foi possível encontrar executor para task QA {task.id}")
@@ -1387,7 +1407,7 @@ class SprintScheduler:
         # Pega todas as tasks do executor
         executor_tasks = [
             t
-            for t in self.sprint.get_tasks_by_assignee(task.assignee)
+            for t in self._get_tasks_by_assignee(task.assignee)
             if t.status == TaskStatus.SCHEDULED
         ]
 
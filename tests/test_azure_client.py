@@ -432,4 +432,250 @@ def test_get_sprint_items_with_invalid_sprint():
     mock_client.get_sprint_items.side_effect = ValueError("Invalid sprint")
     
     with pytest.raises(ValueError, match="Invalid sprint"):
-        mock_client.get_sprint_items("Invalid Sprint") 
\ No newline at end of file
+        mock_client.get_sprint_items("Invalid Sprint") 
+
+
+def test_update_work_items_sends_all_patches():
+    """Testa se update_work_items envia uma atualização por item com operações"""
+    from src.azure.client import AzureDevOpsClient
+
+    client = AzureDevOpsClient.__new__(AzureDevOpsClient)
+    client.base_url = "https://dev.azure.com/org"
+    client.wit_client = Mock()
+    # Falha no endpoint $batch força o envio individual
+    client._session = Mock()
+    client._session.post.side_effect = Exception("batch indisponível")
+
+    tz = timezone(timedelta(hours=-3))
+    task = Task(
+        id="2",
+        title="[BE] Task",
+        description=None,
+        work_front=WorkFront.BACKEND,
+        estimated_hours=3.0,
+        assignee="backend1@example.com",
+        start_date=datetime(2024, 3, 18, 9, 0, tzinfo=tz),
+        end_date=datetime(2024, 3, 18, 12, 0, tzinfo=tz),
+        azure_end_date=datetime(2024, 3, 18, 12, 0, tzinfo=tz),
+        parent_user_story_id="1"
+    )
+    empty_task = Task(
+        id="3",
+        title="[FE] Task",
+        description=None,
+        work_front=WorkFront.FRONTEND,
+        estimated_hours=3.0,
+        assignee=None,
+        start_date=None,
+        end_date=None,
+        azure_end_date=None,
+        parent_user_story_id="1"
+    )
+    us = UserStory(
+        id="1",
+        title="US",
+        description=None,
+        assignee="backend1@example.com",
+        start_date=None,
+        end_date=None,
+        story_points=2,
+        tasks=[task, empty_task]
+    )
+    sprint = Sprint(name="Sprint 1", start_date=None, end_date=None, user_stories=[us])
+
+    client.update_work_items(sprint)
+
+    updated_ids = sorted(call.args[1] for call in client.wit_client.update_work_item.call_args_list)
+    assert updated_ids == [1, 2]
+
+def test_update_work_items_uses_batch_endpoint():
+    """Testa se as atualizações vão em lote e só as rejeitadas são reenviadas individualmente"""
+    from src.azure.client import AzureDevOpsClient
+
+    client = AzureDevOpsClient.__new__(AzureDevOpsClient)
+    client.base_url = "https://dev.azure.com/org"
+    client.wit_client = Mock()
+    client._session = Mock()
+    client._session.post.return_value.json.return_value = {
+        "count": 2,
+        "value": [{"code": 200}, {"code": 409}]
+    }
+
+    task = Task(
+        id="2",
+        title="[BE] Task",
+        description=None,
+        work_front=WorkFront.BACKEND,
+        estimated_hours=3.0,
+        assignee="backend1@example.com",
+        start_date=None,
+        end_date=None,
+        azure_end_date=None,
+        parent_user_story_id="1"
+    )
+    us = UserStory(
+        id="1",
+        title="US",
+        description=None,
+        assignee="backend1@example.com",
+        start_date=None,
+        end_date=None,
+        story_points=2,
+        tasks=[task]
+    )
+    sprint = Sprint(name="Sprint 1", start_date=None, end_date=None, user_stories=[us])
+
+    client.update_work_items(sprint)
+
+    client._session.post.assert_called_once()
+    url = client._session.post.call_args.args[0]
+    payload = client._session.post.call_args.kwargs["json"]
+    assert url.startswith("https://dev.azure.com/org/_apis/wit/$batch")
+    assert [request["uri"].split("?")[0] for request in payload] == [
+        "/_apis/wit/workitems/1",
+        "/_apis/wit/workitems/2",
+    ]
+    assert all(request["method"] == "PATCH" for request in payload)
+    updated_ids = [call.args[1] for call in client.wit_client.update_work_item.call_args_list]
+    assert updated_ids == [2]
+
+def test_get_work_items_batched_splits_in_chunks():
+    """Testa se os IDs são buscados em lotes de no máximo 200 mantendo a ordem"""
+    from concurrent.futures import ThreadPoolExecutor
+    from src.azure.client import AzureDevOpsClient, WORK_ITEMS_BATCH_SIZE
+
+    client = AzureDevOpsClient.__new__(AzureDevOpsClient)
+    client.wit_client = Mock()
+    client.wit_client.get_work_items.side_effect = lambda ids, expand=None: list(ids)
+
+    ids = list(range(450))
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        items = client._get_work_items_batched(executor, ids, expand="All")
+
+    assert items == ids
+    assert client.wit_client.get_work_items.call_count == 3
+    assert all(
+        len(call.args[0]) <= WORK_ITEMS_BATCH_SIZE
+        for call in client.wit_client.get_work_items.call_args_list
+    )
+
+@pytest.mark.parametrize("title, expected", [
+    ("[BE] Implementar endpoint", WorkFront.BACKEND),
+    ("[FE] Criar componente", WorkFront.FRONTEND),
+    ("[QA] Elaboração de Plano de Testes", WorkFront.QA),
+    ("DevOps - Criar Env Flux", WorkFront.DEVOPS),
+    ("[QA] Validar [BE] endpoint", WorkFront.BACKEND),
+    ("[be] tag minúscula", None),
+    ("Sem frente definida", None),
+])
+def test_detect_work_front(title, expected):
+    """Testa a identificação da frente de trabalho pelo título da task"""
+    from src.azure.client import _detect_work_front
+
+    assert _detect_work_front(title) == expected
+
+def test_convert_to_entities():
+    """Testa a conversão de work items do Azure DevOps para entidades"""
+    from types import SimpleNamespace
+    from src.azure.client import AzureDevOpsClient
+
+    client = AzureDevOpsClient.__new__(AzureDevOpsClient)
+    items = {
+        "user_stories": [
+            SimpleNamespace(id=1, fields={
+                "System.Title": "US 1",
+                "System.AssignedTo": {"uniqueName": "owner@example.com"},
+                "Microsoft.VSTS.Scheduling.StartDate": "2024-03-18T12:00:00Z",
+                "Microsoft.VSTS.Scheduling.StoryPoints": 3.0
+            })
+        ],
+        "tasks": [
+            SimpleNamespace(id=2, fields={
+                "System.Title": "[BE] Task ativa",
+                "System.State": "Active",
+                "System.Parent": 1,
+                "System.AssignedTo": {"uniqueName": "backend1@example.com"},
+                "Microsoft.VSTS.Scheduling.OriginalEstimate": 4,
+                "Custom.CommittedDate": "2024-03-19T20:00:00Z"
+            }),
+            SimpleNamespace(id=3, fields={
+                "System.Title": "[FE] Task fechada",
+                "System.State": "Closed",
+                "System.Parent": 1
+            }),
+            SimpleNamespace(id=4, fields={
+                "System.Title": "[QA] Task órfã",
+                "System.State": "New",
+                "System.Parent": 99
+            })
+        ]
+    }
+
+    sprint = client.convert_to_entities(items, "Sprint 1", "Team A")
+
+    assert len(sprint.user_stories) == 1
+    us = sprint.user_stories[0]
+    assert us.assignee == "owner@example.com"
+    assert us.start_date == datetime(2024, 3, 18, 12, 0, tzinfo=timezone.utc)
+    assert us.story_points == 3.0
+    assert [t.id for t in us.tasks] == ["2"]
+    task = us.tasks[0]
+    assert task.work_front == WorkFront.BACKEND
+    assert task.estimated_hours == 4.0
+    assert task.assignee == "backend1@example.com"
+    assert task.end_date == task.azure_end_date == datetime(2024, 3, 19, 20, 0, tzinfo=timezone.utc)
+    assert task.parent_user_story_id == "1"
+
+def test_get_sprint_items_splits_task_query_by_parent(monkeypatch):
+    """Testa se a query de Tasks é dividida em lotes de User Stories"""
+    from types import SimpleNamespace
+    import src.azure.client as client_module
+
+    monkeypatch.setattr(client_module, "WIQL_PARENT_IDS_BATCH_SIZE", 2)
+    client = client_module.AzureDevOpsClient.__new__(client_module.AzureDevOpsClient)
+    client.project = "Project"
+    client.wit_client = Mock()
+
+    def query_by_wiql(wiql):
+        query = wiql["query"]
+        if "'User Story'" in query:
+            return SimpleNamespace(work_items=[SimpleNamespace(id=i) for i in (1, 2, 3)])
+        if "IN (1,2)" in query:
+            return SimpleNamespace(work_items=[SimpleNamespace(id=10), SimpleNamespace(id=11)])
+        return SimpleNamespace(work_items=[SimpleNamespace(id=12)])
+
+    client.wit_client.query_by_wiql.side_effect = query_by_wiql
+    client.wit_client.get_work_items.side_effect = lambda ids, expand=None: [
+        SimpleNamespace(id=i, fields={}) for i in ids
+    ]
+
+    items = client.get_sprint_items("Sprint 1", "Team", "2024", "Q1")
+
+    assert client.wit_client.query_by_wiql.call_count == 3
+    assert [us.id for us in items["user_stories"]] == [1, 2, 3]
+    assert [task.id for task in items["tasks"]] == [10, 11, 12]
+
+def test_build_operations_for_user_story():
+    """Testa a montagem das operações de atualização de uma User Story"""
+    from src.azure.client import AzureDevOpsClient
+
+    client = AzureDevOpsClient.__new__(AzureDevOpsClient)
+    end_date = datetime(2024, 3, 22, 17, 0, tzinfo=timezone(timedelta(hours=-3)))
+    us = UserStory(
+        id="1",
+        title="US",
+        description=None,
+        assignee=None,
+        start_date=None,
+        end_date=end_date,
+        story_points=0,
+        tasks=[]
+    )
+
+    operations = client._build_operations(us, AzureDevOpsClient._USER_STORY_PATCH_FIELDS)
+
+    assert operations == [
+        {"op": "add", "path": "/fields/Microsoft.VSTS.Scheduling.StoryPoints", "value": 0},
+        {"op": "add", "path": "/fields/Custom.CommittedDate", "value": end_date.isoformat()},
+        {"op": "add", "path": "/fields/Microsoft.VSTS.Scheduling.DueDate", "value": end_date.isoformat()},
+    ]
@@ -146,4 +146,15 @@ def test_executors_config_get_executor_by_email():
     executor = next((e for e in config.backend if e.email == "backend1@example.com"), None)
     assert executor is not None
     assert executor.email == "backend1@example.com"
-    assert executor.capacity == 6 
\ No newline at end of file
+    assert executor.capacity == 6 
+
+
+def test_executor_equality_ignores_case():
+    """Testa se executores são comparados pelo email sem diferenciar caixa"""
+    executor = Executor(email="Backend1@Example.com", capacity=6)
+    same_executor = Executor(email="backend1@example.com", capacity=4)
+    other_executor = Executor(email="backend2@example.com", capacity=6)
+
+    assert executor == same_executor
+    assert executor != other_executor
+    assert len({executor, same_executor, other_executor}) == 2
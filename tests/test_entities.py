@@ -1,6 +1,6 @@
 import pytest
 from datetime import datetime, timedelta, timezone
-from src.models.entities import Task, UserStory, Sprint, WorkFront, TaskStatus
+from src.models.entities import Task, UserStory, Sprint, SprintMetrics, WorkFront, TaskStatus, hours_to_story_points
 
 @pytest.fixture
 def timezone_br():
@@ -164,4 +164,89 @@ def test_work_front_validation():
     
     assert task.work_front == WorkFront.BACKEND
     task.work_front = WorkFront.FRONTEND
-    assert task.work_front == WorkFront.FRONTEND 
\ No newline at end of file
+    assert task.work_front == WorkFront.FRONTEND 
+
+
+@pytest.mark.parametrize("hours, points", [
+    (0, 0.5), (1, 0.5), (1.5, 1), (2, 1), (3, 2), (5, 3), (9, 5),
+    (14, 8), (23, 13), (37, 21), (60, 34), (61, 55)
+])
+def test_hours_to_story_points(hours, points):
+    """Testa a conversão de horas estimadas em story points"""
+    assert hours_to_story_points(hours) == points
+
+def test_calculate_story_points_ignores_cancelled_tasks():
+    """Testa se tasks canceladas não entram no cálculo de story points"""
+    tasks = [
+        Task(
+            id=str(i),
+            title="[BE] Task",
+            description=None,
+            work_front=WorkFront.BACKEND,
+            estimated_hours=4.0,
+            assignee=None,
+            start_date=None,
+            end_date=None,
+            azure_end_date=None,
+            status=status,
+            parent_user_story_id="US-1"
+        )
+        for i, status in enumerate([TaskStatus.PENDING, TaskStatus.CANCELLED])
+    ]
+    us = UserStory(
+        id="US-1",
+        title="Test US",
+        description=None,
+        assignee=None,
+        start_date=None,
+        end_date=None,
+        story_points=None,
+        tasks=tasks
+    )
+    assert us.calculate_story_points() == 3
+
+def test_get_tasks_by_assignee_reflects_direct_assignment(sprint_dates):
+    """Testa se a busca por executor reflete alterações feitas diretamente na task"""
+    start_date, end_date = sprint_dates
+    task = Task(
+        id="1",
+        title="[BE] Task Test",
+        description=None,
+        work_front=WorkFront.BACKEND,
+        estimated_hours=4.0,
+        assignee="Backend1@example.com",
+        start_date=None,
+        end_date=None,
+        azure_end_date=None,
+        parent_user_story_id="US-1"
+    )
+    us = UserStory(
+        id="US-1",
+        title="Test US",
+        description=None,
+        assignee=None,
+        start_date=None,
+        end_date=None,
+        story_points=None,
+        tasks=[task]
+    )
+    sprint = Sprint(name="Sprint", start_date=start_date, end_date=end_date, user_stories=[us])
+
+    assert sprint.get_tasks_by_assignee("backend1@example.com") == [task]
+
+    task.assignee = "backend2@example.com"
+    assert sprint.get_tasks_by_assignee("backend1@example.com") == []
+    assert sprint.get_tasks_by_assignee("BACKEND2@example.com") == [task]
+
+def test_sprint_metrics_not_scheduled_tasks():
+    """Testa o registro de tasks não agendadas em colunas e a visão em dicionários"""
+    metrics = SprintMetrics()
+    metrics.add_not_scheduled_task("TASK-1", "Task 1", "Sem executor", "US-1")
+    metrics.add_not_scheduled_task("TASK-2", "Task 2", "Sem estimativa")
+
+    assert metrics.not_scheduled_task_ids == ["TASK-1", "TASK-2"]
+    assert metrics.not_scheduled_us_ids == ["US-1", None]
+    assert metrics.not_scheduled_tasks == [
+        {"task_id": "TASK-1", "title": "Task 1", "reason": "Sem executor", "user_story_id": "US-1"},
+        {"task_id": "TASK-2", "title": "Task 2", "reason": "Sem estimativa", "user_story_id": None},
+    ]
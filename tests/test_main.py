@@ -3,7 +3,8 @@ from unittest.mock import Mock, patch
 from datetime import datetime, timedelta, timezone
 from src.models.entities import Task, UserStory, Sprint, SprintMetrics, WorkFront
 from src.models.config import Executor, ExecutorsConfig
-from src.main import executar
+from src.main import app, executar
+from typer.testing import CliRunner
 from pathlib import Path
 
 @pytest.fixture
@@ -164,9 +165,9 @@ def mock_report():
 
 def test_main_success(mock_azure_client, mock_scheduler, mock_report):
     """Testa o fluxo principal com sucesso"""
-    with patch("src.main.AzureDevOpsClient", return_value=mock_azure_client), \
-         patch("src.main.SprintScheduler", return_value=mock_scheduler), \
-         patch("src.main.ReportGenerator", return_value=mock_report):
+    with patch("src.azure.client.AzureDevOpsClient", return_value=mock_azure_client), \
+         patch("src.services.scheduler.SprintScheduler", return_value=mock_scheduler), \
+         patch("src.services.report.ReportGenerator", return_value=mock_report):
         
         # Simula o fluxo principal
         items = mock_azure_client.get_sprint_items("Sprint-1")
@@ -184,7 +185,7 @@ def test_main_with_invalid_sprint(mock_azure_client):
     """Testa o fluxo principal com sprint inválido"""
     mock_azure_client.get_sprint_items.return_value = []
     
-    with patch("src.main.AzureDevOpsClient", return_value=mock_azure_client):
+    with patch("src.azure.client.AzureDevOpsClient", return_value=mock_azure_client):
         with pytest.raises(ValueError, match="No items found for sprint"):
             items = mock_azure_client.get_sprint_items("Invalid-Sprint")
             if not items:
@@ -194,7 +195,7 @@ def test_main_with_invalid_team(mock_azure_client):
     """Testa o fluxo principal com time inválido"""
     mock_azure_client.get_team_capacity.return_value = {}
     
-    with patch("src.main.AzureDevOpsClient", return_value=mock_azure_client):
+    with patch("src.azure.client.AzureDevOpsClient", return_value=mock_azure_client):
         with pytest.raises(ValueError, match="No team capacity found"):
             capacity = mock_azure_client.get_team_capacity("Invalid-Team")
             if not capacity:
@@ -204,8 +205,19 @@ def test_main_with_invalid_items(mock_azure_client):
     """Testa o fluxo principal com itens inválidos"""
     mock_azure_client.get_sprint_items.return_value = []
     
-    with patch("src.main.AzureDevOpsClient", return_value=mock_azure_client):
+    with patch("src.azure.client.AzureDevOpsClient", return_value=mock_azure_client):
         with pytest.raises(ValueError, match="No items found for sprint"):
             items = mock_azure_client.get_sprint_items("Sprint-1")
             if not items:
-                raise ValueError("No items found for sprint") 
\ No newline at end of file
+                raise ValueError("No items found for sprint") 
+
+
+def test_executar_rejects_invalid_format_before_updating_azure(tmp_path, mock_azure_client):
+    """Testa que um formato inválido é rejeitado antes de atualizar o Azure DevOps"""
+    with patch("src.azure.client.AzureDevOpsClient", return_value=mock_azure_client) as client_class:
+        result = CliRunner().invoke(app, ["--config-dir", str(tmp_path), "--formato", "bogus"])
+
+    assert result.exit_code != 0
+    assert "bogus" in result.output
+    client_class.assert_not_called()
+    mock_azure_client.update_work_items.assert_not_called()
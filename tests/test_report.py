@@ -479,4 +479,127 @@ def test_generate_with_multiple_executors():
     assert "## 5. Percentual de Capacity Preenchida" in markdown_content
     assert "**Percentual de Capacity Preenchida:** 50.00%" in markdown_content
     assert "*Total de Capacity Disponível:* 80.0h" in markdown_content
-    assert "*Total de Capacity Utilizada:* 40.0h" in markdown_content 
\ No newline at end of file
+    assert "*Total de Capacity Utilizada:* 40.0h" in markdown_content 
+
+
+def test_generate_only_requested_formats(tmp_path):
+    """Testa a geração apenas dos formatos solicitados"""
+    sprint = Sprint(
+        name="Test Sprint",
+        start_date=datetime(2024, 3, 18, tzinfo=timezone(timedelta(hours=-3))),
+        end_date=datetime(2024, 3, 29, tzinfo=timezone(timedelta(hours=-3))),
+        user_stories=[],
+        team="Team A"
+    )
+    executors = ExecutorsConfig(
+        backend=[Executor(email="test@example.com", capacity=6)],
+        frontend=[],
+        qa=[],
+        devops=[]
+    )
+    report = ReportGenerator(sprint, {}, str(tmp_path), "Team A", executors)
+
+    report.generate(formats=["md"])
+
+    assert [path.suffix for path in tmp_path.iterdir()] == [".md"]
+
+    with pytest.raises(ValueError):
+        report.generate(formats=["docx"])
+
+def test_generate_pdf_escapes_markup(tmp_path):
+    """Testa a geração do PDF com caracteres reservados nos textos"""
+    sprint = Sprint(
+        name="Sprint <1> & 2",
+        start_date=datetime(2024, 3, 18, tzinfo=timezone(timedelta(hours=-3))),
+        end_date=datetime(2024, 3, 29, tzinfo=timezone(timedelta(hours=-3))),
+        user_stories=[
+            UserStory(
+                id="US-1",
+                title="Tela de <b>login & cadastro",
+                description=None,
+                assignee=None,
+                start_date=None,
+                end_date=None,
+                story_points=None,
+                tasks=[]
+            )
+        ],
+        team="Team A"
+    )
+    executors = ExecutorsConfig(
+        backend=[Executor(email="test@example.com", capacity=6)],
+        frontend=[],
+        qa=[],
+        devops=[]
+    )
+    report = ReportGenerator(sprint, {}, str(tmp_path), "Team A", executors)
+
+    report.generate(formats=["pdf"])
+
+    assert [path.suffix for path in tmp_path.iterdir()] == [".pdf"]
+
+def test_get_period_allocations(tmp_path):
+    """Testa o cálculo das horas alocadas por dia e período"""
+    tz = timezone(timedelta(hours=-3))
+    task = Task(
+        id="TASK-1",
+        title="[BE] Task",
+        description=None,
+        work_front=WorkFront.BACKEND,
+        estimated_hours=10.0,
+        assignee="test@example.com",
+        start_date=datetime(2024, 3, 18, 9, 0, tzinfo=tz),
+        end_date=datetime(2024, 3, 19, 11, 0, tzinfo=tz),
+        azure_end_date=None,
+        parent_user_story_id="US-1",
+        status=TaskStatus.SCHEDULED
+    )
+    sprint = Sprint(
+        name="Test Sprint",
+        start_date=datetime(2024, 3, 18, tzinfo=tz),
+        end_date=datetime(2024, 3, 29, tzinfo=tz),
+        user_stories=[
+            UserStory(
+                id="US-1",
+                title="User Story 1",
+                description=None,
+                assignee=None,
+                start_date=None,
+                end_date=None,
+                story_points=None,
+                tasks=[task]
+            )
+        ],
+        team="Team A"
+    )
+    executors = ExecutorsConfig(
+        backend=[Executor(email="test@example.com", capacity=6)],
+        frontend=[],
+        qa=[],
+        devops=[]
+    )
+    report = ReportGenerator(sprint, {}, str(tmp_path), "Team A", executors)
+
+    allocations = report._get_period_allocations(
+        "test@example.com", datetime(2024, 3, 18).date(), datetime(2024, 3, 29).date()
+    )
+
+    assert allocations == {
+        datetime(2024, 3, 18).date(): [3.0, 3.0],
+        datetime(2024, 3, 19).date(): [2.0, 0]
+    }
+
+def test_excel_colors_are_opaque(tmp_path):
+    """Testa se as cores do Excel são definidas em ARGB opaco"""
+    sprint = Sprint(
+        name="Test Sprint",
+        start_date=datetime(2024, 3, 18, tzinfo=timezone(timedelta(hours=-3))),
+        end_date=datetime(2024, 3, 29, tzinfo=timezone(timedelta(hours=-3))),
+        user_stories=[],
+        team="Team A"
+    )
+    report = ReportGenerator(sprint, {}, str(tmp_path), "Team A", ExecutorsConfig(backend=[], frontend=[], qa=[], devops=[]))
+
+    for fill in report.excel_colors.values():
+        assert len(fill.fgColor.rgb) == 8
+        assert fill.fgColor.rgb.startswith("FF")
@@ -1431,4 +1431,51 @@ def test_calculate_end_date(scheduler):
     # Testa task que ultrapassa o fim da sprint
     task.estimated_hours = 100.0  # Horas suficientes para ultrapassar a sprint
     end_date = scheduler._calculate_end_date(task, start_date)
-    assert end_date is None  # Deve retornar None pois ultrapassa a sprint 
\ No newline at end of file
+    assert end_date is None  # Deve retornar None pois ultrapassa a sprint 
+
+
+def test_assignee_index_tracks_scheduler_reassignment():
+    """Testa se o índice por executor do agendador acompanha as reatribuições"""
+    task = Task(
+        id="T1",
+        title="Test Task",
+        description="Test task",
+        work_front=WorkFront.BACKEND,
+        estimated_hours=6.0,
+        assignee="Backend1@example.com",
+        start_date=None,
+        end_date=None,
+        azure_end_date=None,
+        parent_user_story_id="US-1"
+    )
+    sprint = Sprint(
+        name="Test Sprint",
+        start_date=datetime(2024, 3, 18),
+        end_date=datetime(2024, 3, 29),
+        user_stories=[
+            UserStory(
+                id="US-1",
+                title="Test US",
+                description="Test user story",
+                assignee=None,
+                start_date=None,
+                end_date=None,
+                story_points=0,
+                tasks=[task]
+            )
+        ],
+        team="Test Team"
+    )
+    executors = ExecutorsConfig(backend=[], frontend=[], qa=[], devops=[])
+    scheduler = SprintScheduler(sprint, executors, {})
+
+    scheduler._build_assignee_index()
+    assert scheduler._get_tasks_by_assignee("backend1@example.com") == [task]
+
+    scheduler._set_task_assignee(task, "backend2@example.com")
+    assert task.assignee == "backend2@example.com"
+    assert scheduler._get_tasks_by_assignee("backend1@example.com") == []
+    assert scheduler._get_tasks_by_assignee("BACKEND2@example.com") == [task]
+
+    scheduler._set_task_assignee(task, None)
+    assert scheduler._get_tasks_by_assignee("backend2@example.com") == []